@@ -3,6 +3,18 @@ Chapter 1-1: 파이썬 함수와 스코프
 파이썬의 함수 정의, 인자 전달 방식, 스코프를 학습한다.
 """
 
+import io
+import os
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import repeat
+from multiprocessing import Process, shared_memory
+from operator import add, mul
+
 
 # ========================================
 # 1. 기본 함수 정의와 호출
@@ -137,6 +149,897 @@ def calculate_tax(amount, tax_rate=0.1):
     return amount * (1 + tax_rate)
 
 
+# ========================================
+# 5. 대량 처리: 배치 장바구니 가격 계산
+# ========================================
+
+class CartBatch:
+    """
+    여러 장바구니를 연속된 정수 배열 하나에 담아 한 번에 계산한다
+
+    모든 가격은 prices 배열에 이어 붙이고,
+    각 장바구니의 시작 위치는 offsets 배열에 기록한다.
+    (i번째 장바구니 = prices[offsets[i]:offsets[i + 1]])
+
+    결과는 calculate_total, apply_discount_safe, calculate_tax를
+    장바구니마다 호출한 것과 완전히 같다.
+    """
+
+    def __init__(self, carts):
+        """
+        Args:
+            carts: 장바구니(정수 가격 리스트)들의 리스트
+        """
+        self.prices = array("q")
+        self.offsets = array("q", [0])
+        for cart in carts:
+            self.prices.extend(cart)
+            self.offsets.append(len(self.prices))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def _slices(self):
+        """장바구니별 가격 구간을 차례로 돌려준다"""
+        prices = self.prices
+        offsets = self.offsets
+        for i in range(len(offsets) - 1):
+            yield prices[offsets[i]:offsets[i + 1]]
+
+    def totals(self):
+        """
+        장바구니별 총액을 계산한다 (calculate_total과 동일)
+
+        Returns:
+            총액 리스트 (정수)
+        """
+        return [sum(prices) for prices in self._slices()]
+
+    def discounted_totals(self, discount_rate):
+        """
+        할인 후 장바구니별 총액을 계산한다
+
+        calculate_total(apply_discount_safe(cart, discount_rate))와
+        같은 순서로 곱하고 더하므로 float 반올림 결과도 같다.
+
+        Args:
+            discount_rate: 할인율 (0.0 ~ 1.0)
+
+        Returns:
+            할인 후 총액 리스트
+        """
+        factor = 1 - discount_rate
+        return [
+            reduce(add, map(factor.__mul__, prices), 0)
+            for prices in self._slices()
+        ]
+
+    def totals_with_tax(self, discount_rate=None, tax_rate=0.1):
+        """
+        세금 포함 장바구니별 총액을 계산한다
+
+        Args:
+            discount_rate: 할인율 (None이면 할인 없이 계산)
+            tax_rate: 세율 (기본값 0.1 = 10%)
+
+        Returns:
+            세금 포함 총액 리스트
+        """
+        if discount_rate is None:
+            amounts = self.totals()
+        else:
+            amounts = self.discounted_totals(discount_rate)
+        return [calculate_tax(amount, tax_rate) for amount in amounts]
+
+
+# ========================================
+# 6. 대량 처리: 스트리밍 총액 계산
+# ========================================
+
+class StreamTotal:
+    """
+    스트리밍 총액 계산의 결과이자 재개 지점(체크포인트)
+
+    offset은 소스에서 소비한 위치다.
+    바이트 스트림은 바이트 수, 문자열 스트림은 문자 수,
+    숫자 iterable은 항목 수를 센다.
+
+    스트림이 구분자 없이 끝나면 마지막 토큰은 total과 count에는 포함하지만,
+    offset은 마지막 구분자 뒤에 둔다. 재개할 때는 settled_total,
+    settled_count에서 시작해 그 토큰을 다시 읽으므로
+    소스 뒤에 이어 쓰인 내용(예: "12" → "123")도 올바르게 더해진다.
+    """
+
+    def __init__(self, total=0, count=0, offset=0, processed=0, elapsed=0.0,
+                 settled_total=None, settled_count=None):
+        """
+        Args:
+            total: 지금까지의 총액
+            count: 지금까지 더한 가격 개수
+            offset: 소스에서 소비한 위치 (끝나지 않은 마지막 토큰 제외)
+            processed: 이번 호출에서 더한 가격 개수
+            elapsed: 이번 호출에 걸린 시간 (초)
+            settled_total: offset까지의 총액 (None이면 total)
+            settled_count: offset까지의 개수 (None이면 count)
+        """
+        self.total = total
+        self.count = count
+        self.offset = offset
+        self.processed = processed
+        self.elapsed = elapsed
+        self.settled_total = total if settled_total is None else settled_total
+        self.settled_count = count if settled_count is None else settled_count
+
+    @property
+    def items_per_second(self):
+        """이번 호출에서 초당 처리한 가격 개수"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.processed / self.elapsed
+
+    def __repr__(self):
+        return (
+            f"StreamTotal(total={self.total}, count={self.count}, "
+            f"offset={self.offset}, {self.items_per_second:,.0f} items/s)"
+        )
+
+
+def _parse_price(token):
+    """가격 토큰(str 또는 bytes)을 숫자로 변환한다"""
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def _iter_pieces(source, chunk_size):
+    """파일 객체는 chunk_size 단위로 읽고, 그 외에는 그대로 순회한다"""
+    if hasattr(source, "read"):
+        while True:
+            piece = source.read(chunk_size)
+            if not piece:
+                return
+            yield piece
+    else:
+        yield from source
+
+
+def calculate_total_stream(source, chunk_size=1 << 16, checkpoint=None):
+    """
+    가격 스트림을 조금씩 읽으며 총액을 계산한다 (메모리 사용량 일정)
+
+    source로 받을 수 있는 것:
+    - 숫자 iterable: 각 항목을 가격으로 더한다
+    - 파일 객체 (텍스트/바이너리): chunk_size씩 읽는다
+    - str/bytes 조각의 iterable: 이어 붙인 하나의 스트림으로 본다
+    스트림 안의 가격은 줄바꿈 또는 쉼표로 구분한다.
+
+    메모리에는 현재 조각과 아직 끝나지 않은 마지막 토큰만 남는다.
+    더하는 순서가 같으므로 결과는 calculate_total과 같다.
+
+    Args:
+        source: 가격 소스
+        chunk_size: 파일 객체에서 한 번에 읽을 크기
+        checkpoint: 이전 호출이 반환한 StreamTotal (여기서부터 재개)
+
+    Returns:
+        StreamTotal (총액, 개수, 소비 위치, 처리 속도)
+    """
+    total, count, offset = 0, 0, 0
+    if checkpoint is not None:
+        total, count = checkpoint.settled_total, checkpoint.settled_count
+        offset = checkpoint.offset
+
+    # 앞부분 건너뛰기: 탐색 가능한 바이너리 파일은 seek, 나머지는 읽으며 버린다
+    skip = offset
+    if (
+        skip
+        and not isinstance(source, io.TextIOBase)
+        and hasattr(source, "seekable")
+        and source.seekable()
+    ):
+        source.seek(skip)
+        skip = 0
+
+    start_count = count
+    started = time.perf_counter()
+    pending = None
+    for piece in _iter_pieces(source, chunk_size):
+        if not isinstance(piece, (str, bytes)):
+            if skip:
+                skip -= 1
+                continue
+            total += piece
+            count += 1
+            offset += 1
+            continue
+
+        if skip:
+            if len(piece) <= skip:
+                skip -= len(piece)
+                continue
+            piece = piece[skip:]
+            skip = 0
+
+        newline, comma = ("\n", ",") if isinstance(piece, str) else (b"\n", b",")
+        data = pending + piece if pending else piece
+        tokens = data.replace(comma, newline).split(newline)
+        pending = tokens.pop()  # 다음 조각으로 이어질 수 있는 마지막 토큰
+        for token in tokens:
+            if token.strip():
+                total += _parse_price(token)
+                count += 1
+        offset += len(data) - len(pending)
+
+    # 끝나지 않은 마지막 토큰은 결과에만 더하고 offset은 옮기지 않는다
+    settled_total, settled_count = total, count
+    if pending and pending.strip():
+        total += _parse_price(pending)
+        count += 1
+
+    elapsed = time.perf_counter() - started
+    return StreamTotal(
+        total, count, offset, count - start_count, elapsed,
+        settled_total, settled_count,
+    )
+
+
+# ========================================
+# 7. 대량 처리: 누적 합계를 유지하는 Cart
+# ========================================
+
+class Cart:
+    """
+    상품이 하나씩 바뀔 때마다 합계를 O(1)로 갱신하는 장바구니
+
+    calculate_total처럼 매번 전체를 다시 더하지 않고,
+    추가/삭제/가격 변경 시 차이만큼만 누적 합계를 조정한다.
+    모든 변경은 기록되어 undo()로 되돌릴 수 있다.
+
+    가격이 정수이면 subtotal은 calculate_total(cart.prices())와 항상 같다.
+    할인 후 금액은 subtotal에 (1 - 할인율)을 곱해 구하므로
+    apply_discount_safe로 상품별 할인 후 더한 값과
+    float 반올림 수준의 차이가 날 수 있다.
+    """
+
+    def __init__(self, discount_rate=0.0, tax_rate=0.1):
+        """
+        Args:
+            discount_rate: 할인율 (0.0 ~ 1.0)
+            tax_rate: 세율 (기본값 0.1 = 10%)
+        """
+        self.discount_rate = discount_rate
+        self.tax_rate = tax_rate
+        self._prices = []  # 삭제된 자리는 None으로 남겨 순서와 ID를 유지한다
+        self._history = []  # (상품 ID, 변경 전 가격) 기록
+        self._size = 0
+        self._subtotal = 0
+
+    def _set(self, item_id, price):
+        """상품 자리의 가격을 바꾸고 합계와 개수를 조정한다"""
+        old = self._prices[item_id]
+        if old is not None:
+            self._subtotal -= old
+            self._size -= 1
+        if price is not None:
+            self._subtotal += price
+            self._size += 1
+        self._prices[item_id] = price
+        return old
+
+    def _check(self, item_id):
+        """현재 장바구니에 있는 상품 ID인지 확인한다 (없으면 KeyError)"""
+        if not 0 <= item_id < len(self._prices) or self._prices[item_id] is None:
+            raise KeyError(item_id)
+
+    def add(self, price):
+        """
+        상품을 추가한다
+
+        Args:
+            price: 상품 가격
+
+        Returns:
+            상품 ID (remove, change_price에 사용)
+        """
+        self._prices.append(None)
+        item_id = len(self._prices) - 1
+        self._set(item_id, price)
+        self._history.append((item_id, None))
+        return item_id
+
+    def remove(self, item_id):
+        """
+        상품을 삭제한다
+
+        Args:
+            item_id: add가 반환한 상품 ID
+        """
+        self._check(item_id)
+        old = self._set(item_id, None)
+        self._history.append((item_id, old))
+
+    def change_price(self, item_id, price):
+        """
+        상품 가격을 변경한다
+
+        Args:
+            item_id: add가 반환한 상품 ID
+            price: 새 가격
+        """
+        self._check(item_id)
+        old = self._set(item_id, price)
+        self._history.append((item_id, old))
+
+    def undo(self):
+        """
+        마지막 변경을 되돌린다
+
+        Returns:
+            되돌린 변경이 있었으면 True
+        """
+        if not self._history:
+            return False
+        item_id, old = self._history.pop()
+        self._set(item_id, old)
+        if old is None and item_id == len(self._prices) - 1:
+            self._prices.pop()  # 방금 추가했던 자리는 아예 없앤다
+        return True
+
+    def __len__(self):
+        return self._size
+
+    def prices(self):
+        """현재 상품 가격 리스트를 추가한 순서대로 반환한다"""
+        return [price for price in self._prices if price is not None]
+
+    @property
+    def subtotal(self):
+        """할인 전 총액"""
+        return self._subtotal
+
+    @property
+    def discounted_subtotal(self):
+        """할인 후 총액"""
+        return self._subtotal * (1 - self.discount_rate)
+
+    @property
+    def total(self):
+        """할인과 세금이 모두 적용된 최종 금액"""
+        return calculate_tax(self.discounted_subtotal, self.tax_rate)
+
+
+# ========================================
+# 8. 대량 처리: 복사 없는 할인 뷰
+# ========================================
+
+class DiscountedView:
+    """
+    원본 장바구니를 복사하지 않고 할인된 가격을 보여주는 뷰
+
+    apply_discount_safe처럼 원본을 건드리지 않지만 새 리스트도 만들지 않는다.
+    가격은 읽을 때마다 원본에서 계산하므로 원본이 바뀌면 뷰에도 반영된다.
+    여러 할인을 겹치면 apply_discount_safe를 차례로 호출한 것과 같은 값이 나온다.
+    """
+
+    def __init__(self, cart, discount_rate, _factors=()):
+        """
+        Args:
+            cart: 상품 가격 리스트 (수정하지 않는다)
+            discount_rate: 할인율 (0.0 ~ 1.0)
+        """
+        self._cart = cart
+        self._factors = _factors + (1 - discount_rate,)
+
+    def _apply(self, price):
+        for factor in self._factors:
+            price = price * factor
+        return price
+
+    def discount(self, discount_rate):
+        """
+        할인을 하나 더 겹친 새 뷰를 반환한다
+
+        Args:
+            discount_rate: 추가 할인율 (0.0 ~ 1.0)
+
+        Returns:
+            같은 원본을 보는 새 DiscountedView
+        """
+        return DiscountedView(self._cart, discount_rate, self._factors)
+
+    def __len__(self):
+        return len(self._cart)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._apply(price) for price in self._cart[index]]
+        return self._apply(self._cart[index])
+
+    def __iter__(self):
+        if len(self._factors) == 1:
+            return map(mul, self._cart, repeat(self._factors[0]))
+        return map(self._apply, self._cart)
+
+    def total(self):
+        """할인 후 총액을 계산한다 (calculate_total과 동일)"""
+        return calculate_total(self)
+
+    def materialize(self):
+        """할인된 가격을 새 리스트로 복사한다 (apply_discount_safe와 동일)"""
+        return list(self)
+
+    def __repr__(self):
+        rates = [round(1 - factor, 10) for factor in self._factors]
+        return f"DiscountedView({len(self)}개 상품, 할인율={rates})"
+
+
+# ========================================
+# 9. 대량 처리: 카테고리별 할인/세금 규칙 엔진
+# ========================================
+
+# 규칙 예시
+# {
+#     "category_discounts": {"전자제품": 0.1},      # 카테고리별 할인율
+#     "thresholds": [(50000, 0.05), (100000, 0.1)],  # 가격 이상이면 추가 할인 (가장 큰 것 하나)
+#     "max_discount": 20000,                        # 상품당 최대 할인액
+#     "tax_rates": {"식품": 0.0},                    # 카테고리별 세율
+#     "default_tax_rate": 0.1,                      # 그 외 세율
+# }
+
+
+def price_item_naive(category, price, rules):
+    """
+    규칙을 그대로 해석해 상품 하나의 최종 가격을 계산한다
+
+    Args:
+        category: 상품 카테고리
+        price: 상품 가격
+        rules: 할인/세금 규칙 딕셔너리
+
+    Returns:
+        할인과 세금이 적용된 가격
+    """
+    rate = rules.get("category_discounts", {}).get(category, 0.0)
+    best = 0.0
+    for threshold, threshold_rate in rules.get("thresholds", []):
+        if price >= threshold and threshold_rate > best:
+            best = threshold_rate
+    discount = price * (rate + best)
+    cap = rules.get("max_discount")
+    if cap is not None and discount > cap:
+        discount = cap
+    tax_rate = rules.get("tax_rates", {}).get(category, rules.get("default_tax_rate", 0.1))
+    return calculate_tax(price - discount, tax_rate)
+
+
+def apply_rules_naive(items, rules):
+    """
+    상품마다 규칙을 해석해 최종 가격을 계산한다
+
+    Args:
+        items: (카테고리, 가격) 튜플 리스트
+        rules: 할인/세금 규칙 딕셔너리
+
+    Returns:
+        최종 가격 리스트
+    """
+    return [price_item_naive(category, price, rules) for category, price in items]
+
+
+class PricingRules:
+    """
+    규칙을 한 번만 해석해 조회 테이블로 만들어 두는 규칙 엔진
+
+    - 가격 구간 경계(thresholds)는 정렬해 두고 bisect로 구간을 찾는다
+    - 카테고리마다 "구간별 총 할인율"과 "세금 배수(1 + 세율)" 테이블을 만든다
+    상품 하나는 딕셔너리 조회 한 번과 bisect 한 번으로 계산된다.
+    결과는 apply_rules_naive와 완전히 같다.
+    """
+
+    def __init__(self, rules):
+        """
+        Args:
+            rules: 할인/세금 규칙 딕셔너리
+        """
+        thresholds = sorted(rules.get("thresholds", []))
+        self._bounds = [threshold for threshold, _ in thresholds]
+
+        # best[i]: 경계 i개를 넘었을 때 적용되는 가장 큰 구간 할인율
+        best = [0.0]
+        for _, threshold_rate in thresholds:
+            best.append(threshold_rate if threshold_rate > best[-1] else best[-1])
+
+        category_discounts = rules.get("category_discounts", {})
+        tax_rates = rules.get("tax_rates", {})
+        default_tax_rate = rules.get("default_tax_rate", 0.1)
+        self._cap = rules.get("max_discount")
+        self._default = (best, 1 + default_tax_rate)
+        self._tables = {}
+        for category in set(category_discounts) | set(tax_rates):
+            rate = category_discounts.get(category, 0.0)
+            self._tables[category] = (
+                [rate + threshold_rate for threshold_rate in best],
+                1 + tax_rates.get(category, default_tax_rate),
+            )
+
+    def apply(self, items):
+        """
+        상품 묶음 전체에 규칙을 한 번에 적용한다
+
+        Args:
+            items: (카테고리, 가격) 튜플 리스트
+
+        Returns:
+            최종 가격 리스트
+        """
+        bounds = self._bounds
+        cap = self._cap
+        lookup = self._tables.get
+        default = self._default
+        result = []
+        append = result.append
+        for category, price in items:
+            rates, tax_factor = lookup(category, default)
+            discount = price * rates[bisect_right(bounds, price)]
+            if cap is not None and discount > cap:
+                discount = cap
+            append((price - discount) * tax_factor)
+        return result
+
+    def total(self, items):
+        """규칙이 적용된 총액을 계산한다"""
+        return calculate_total(self.apply(items))
+
+
+def benchmark_pricing_rules(n=100000, rules=None):
+    """
+    규칙 엔진과 상품별 규칙 해석의 속도를 비교한다
+
+    Args:
+        n: 상품 개수
+        rules: 할인/세금 규칙 (None이면 예시 규칙)
+
+    Returns:
+        (해석 방식 소요 시간, 규칙 엔진 소요 시간) 초 단위
+    """
+    if rules is None:
+        rules = {
+            "category_discounts": {"전자제품": 0.1, "의류": 0.2, "도서": 0.05},
+            "thresholds": [(10000, 0.01), (50000, 0.03), (100000, 0.05), (150000, 0.07)],
+            "max_discount": 20000,
+            "tax_rates": {"식품": 0.0, "도서": 0.0},
+            "default_tax_rate": 0.1,
+        }
+    categories = ["전자제품", "의류", "도서", "식품", "기타"]
+    items = [(categories[i % 5], 1000 + (i * 7919) % 200000) for i in range(n)]
+
+    started = time.perf_counter()
+    expected = apply_rules_naive(items, rules)
+    naive_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    engine = PricingRules(rules)
+    result = engine.apply(items)
+    compiled_seconds = time.perf_counter() - started
+
+    if result != expected:
+        raise AssertionError("규칙 엔진 결과가 해석 방식과 다르다")
+    return naive_seconds, compiled_seconds
+
+
+# ========================================
+# 10. 대량 처리: 샤딩된 카운터
+# ========================================
+
+# 비교용: 락으로 보호한 전역 카운터
+locked_counter = 0
+_locked_counter_lock = threading.Lock()
+
+
+def increment_locked(n=1):
+    """
+    락으로 보호한 전역 카운터를 증가시킨다
+    스레드에 안전하지만 모든 스레드가 락 하나를 두고 경쟁한다
+    """
+    global locked_counter
+    with _locked_counter_lock:
+        locked_counter += n
+
+
+class ShardedCounter:
+    """
+    스레드마다 자기 칸(shard)에만 더하는 카운터
+
+    increment()는 자기 스레드의 칸만 수정하므로 락이 필요 없다.
+    snapshot()은 모든 칸을 더해 전체 값을 만든다.
+    스냅샷을 요청하기 전에 끝난 increment()는 모두 포함된다.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def _register(self):
+        """현재 스레드의 칸을 만들어 등록한다 (스레드마다 한 번)"""
+        cell = [0]
+        with self._lock:
+            self._shards.append(cell)
+        self._local.cell = cell
+        return cell
+
+    def increment(self, n=1):
+        """
+        카운터를 증가시킨다
+
+        Args:
+            n: 증가량 (기본값 1)
+        """
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._register()
+        cell[0] += n
+
+    def snapshot(self):
+        """
+        모든 칸을 합친 전체 값을 반환한다
+
+        Returns:
+            현재까지의 총 증가량
+        """
+        with self._lock:
+            return sum(cell[0] for cell in self._shards)
+
+
+class SharedMemoryCounter:
+    """
+    여러 프로세스가 하나의 값으로 세는 공유 메모리 카운터
+
+    공유 메모리에 프로세스별 칸(slot)을 두고,
+    각 프로세스는 자기 칸에만 더한다. snapshot()은 모든 칸을 더한다.
+    만든 쪽은 name으로 다른 프로세스에 알려주고,
+    다른 프로세스는 SharedMemoryCounter(slots, name)로 연결한다.
+    """
+
+    def __init__(self, slots=64, name=None):
+        """
+        Args:
+            slots: 칸 개수 (동시에 세는 프로세스 수 이상)
+            name: 연결할 공유 메모리 이름 (None이면 새로 만든다)
+        """
+        self._owner = name is None
+        self._shm = shared_memory.SharedMemory(name=name, create=self._owner, size=slots * 8)
+        self._cells = self._shm.buf.cast("q")
+        self.slots = slots
+        if self._owner:
+            for slot in range(slots):
+                self._cells[slot] = 0
+
+    @property
+    def name(self):
+        """다른 프로세스가 연결할 때 쓰는 공유 메모리 이름"""
+        return self._shm.name
+
+    def increment(self, slot, n=1):
+        """
+        자기 칸의 값을 증가시킨다
+
+        Args:
+            slot: 이 프로세스가 사용하는 칸 번호 (프로세스마다 달라야 한다)
+            n: 증가량 (기본값 1)
+        """
+        self._cells[slot] += n
+
+    def snapshot(self):
+        """모든 칸을 합친 전체 값을 반환한다"""
+        return sum(self._cells)
+
+    def close(self):
+        """연결을 닫는다 (만든 쪽이면 공유 메모리도 삭제한다)"""
+        self._cells.release()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+def _count_in_process(name, slots, slot, increments):
+    """워커 프로세스: 공유 카운터에 연결해 자기 칸에 센다"""
+    counter = SharedMemoryCounter(slots, name)
+    for _ in range(increments):
+        counter.increment(slot)
+    counter.close()
+
+
+def count_with_processes(workers=4, increments=10000):
+    """
+    여러 프로세스가 공유 메모리 카운터 하나에 센다
+
+    Args:
+        workers: 워커 프로세스 수
+        increments: 프로세스당 증가 횟수
+
+    Returns:
+        전체 합계 (workers × increments)
+    """
+    counter = SharedMemoryCounter(slots=workers)
+    try:
+        processes = [
+            Process(target=_count_in_process, args=(counter.name, workers, slot, increments))
+            for slot in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        return counter.snapshot()
+    finally:
+        counter.close()
+
+
+def benchmark_counters(threads=4, increments=100000):
+    """
+    락으로 보호한 전역 카운터와 ShardedCounter의 다중 스레드 처리량을 비교한다
+
+    Args:
+        threads: 스레드 수
+        increments: 스레드당 증가 횟수
+
+    Returns:
+        (락 카운터 소요 시간, 샤딩 카운터 소요 시간) 초 단위
+    """
+    global locked_counter
+
+    def run(target):
+        workers = [threading.Thread(target=target) for _ in range(threads)]
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return time.perf_counter() - started
+
+    def locked_worker():
+        for _ in range(increments):
+            increment_locked()
+
+    sharded = ShardedCounter()
+
+    def sharded_worker():
+        increment = sharded.increment
+        for _ in range(increments):
+            increment()
+
+    locked_counter = 0
+    locked_seconds = run(locked_worker)
+    sharded_seconds = run(sharded_worker)
+    if not locked_counter == sharded.snapshot() == threads * increments:
+        raise AssertionError("카운터 합계가 맞지 않는다")
+    return locked_seconds, sharded_seconds
+
+
+# ========================================
+# 11. 대량 처리: 프로세스 풀 할인 파이프라인
+# ========================================
+
+# 병렬 처리를 시작하는 기본 상품 수 (benchmark_bulk_discount로 측정한 손익분기점)
+# 현재 프로세스: 상품당 약 140ns
+# 프로세스 풀: 고정 비용 약 12ms + 상품당 복사 등 약 40ns + 계산 140ns / 워커 수
+# → 워커 2개는 약 40만 개, 4개는 약 20만 개부터 빨라진다
+MIN_PARALLEL_DISCOUNT = 400000
+
+
+def _discount_shared_range(prices_name, results_name, factor, start, stop):
+    """워커 프로세스: 공유 메모리의 가격 구간에 할인을 적용해 결과 구간에 쓴다"""
+    prices_shm = shared_memory.SharedMemory(name=prices_name)
+    results_shm = shared_memory.SharedMemory(name=results_name)
+    prices = prices_shm.buf.cast("q")
+    results = results_shm.buf.cast("d")
+    try:
+        results[start:stop] = array("d", map(mul, prices[start:stop], repeat(factor)))
+    finally:
+        prices.release()
+        results.release()
+        prices_shm.close()
+        results_shm.close()
+
+
+def bulk_apply_discount(batch, discount_rate, workers=None, chunk_size=None, min_parallel=MIN_PARALLEL_DISCOUNT):
+    """
+    CartBatch의 모든 가격에 할인을 적용한다 (여러 프로세스로 나누어 처리)
+
+    입력도 결과도 열(column) 형태 그대로 다룬다.
+    가격 배열을 공유 메모리에 한 번에 복사해 두고, 워커 프로세스들은
+    구간 번호만 받아 결과 공유 메모리의 자기 구간에 쓴다.
+    가격 데이터를 pickle로 주고받지 않고, 장바구니별 리스트도 만들지 않는다.
+    상품 수가 min_parallel보다 적거나 워커가 하나뿐이면
+    프로세스를 띄우는 비용이 더 크므로 현재 프로세스에서 처리한다.
+
+    Args:
+        batch: 할인을 적용할 CartBatch
+        discount_rate: 할인율 (0.0 ~ 1.0)
+        workers: 워커 프로세스 수 (None이면 CPU 개수)
+        chunk_size: 워커 하나가 한 번에 처리할 상품 수 (None이면 자동)
+        min_parallel: 병렬 처리를 시작하는 최소 상품 수
+
+    Returns:
+        할인된 가격 배열 (array('d'), batch.prices와 같은 순서)
+        i번째 장바구니 = 결과[batch.offsets[i]:batch.offsets[i + 1]]이며,
+        apply_discount_safe(장바구니, discount_rate)와 같은 값이다.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    size = len(batch.prices)
+    factor = 1 - discount_rate
+    if size == 0 or size < min_parallel or workers <= 1:
+        return array("d", map(mul, batch.prices, repeat(factor)))
+
+    if chunk_size is None:
+        chunk_size = -(-size // (workers * 4))  # 워커당 4개 정도로 나눈다
+
+    prices_shm = shared_memory.SharedMemory(create=True, size=size * 8)
+    results_shm = shared_memory.SharedMemory(create=True, size=size * 8)
+    try:
+        prices_shm.buf[:size * 8] = memoryview(batch.prices).cast("B")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _discount_shared_range,
+                    prices_shm.name,
+                    results_shm.name,
+                    factor,
+                    start,
+                    min(start + chunk_size, size),
+                )
+                for start in range(0, size, chunk_size)
+            ]
+            for future in futures:
+                future.result()
+
+        results = array("d")
+        results.frombytes(results_shm.buf[:size * 8])
+    finally:
+        prices_shm.close()
+        prices_shm.unlink()
+        results_shm.close()
+        results_shm.unlink()
+    return results
+
+
+def benchmark_bulk_discount(sizes=(100000, 400000, 1000000), workers=None, discount_rate=0.2):
+    """
+    현재 프로세스 처리와 프로세스 풀 처리의 소요 시간을 크기별로 비교한다
+
+    MIN_PARALLEL_DISCOUNT를 정할 때 손익분기점을 찾는 데 쓴다.
+
+    Args:
+        sizes: 비교할 상품 수들
+        workers: 워커 프로세스 수 (None이면 CPU 개수)
+        discount_rate: 할인율
+
+    Returns:
+        (상품 수, 현재 프로세스 소요 시간, 프로세스 풀 소요 시간) 리스트 (초 단위)
+    """
+    rows = []
+    for size in sizes:
+        batch = CartBatch([range(start, min(start + 10, size)) for start in range(0, size, 10)])
+
+        started = time.perf_counter()
+        serial = bulk_apply_discount(batch, discount_rate, workers=1)
+        serial_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        parallel = bulk_apply_discount(batch, discount_rate, workers=workers, min_parallel=0)
+        parallel_seconds = time.perf_counter() - started
+
+        if serial != parallel:
+            raise AssertionError("할인 결과가 맞지 않는다")
+        rows.append((size, serial_seconds, parallel_seconds))
+    return rows
+
+
 # ========================================
 # 메인 실행
 # ========================================
@@ -224,6 +1127,124 @@ if __name__ == "__main__":
     amount_with_tax_15 = calculate_tax(final_amount, 0.15)
     print(f"세금 15% 포함 금액: {amount_with_tax_15:,.0f}원")
     
+    print("\n" + "=" * 50)
+    print("5. 대량 처리: 배치 장바구니 가격 계산")
+    print("=" * 50)
+    
+    carts = [[10000, 25000, 15000], [8000, 12000], []]
+    batch = CartBatch(carts)
+    print(f"\n장바구니 {len(batch)}개: {carts}")
+    print(f"총액: {batch.totals()}")
+    print(f"20% 할인 후 총액: {batch.discounted_totals(0.2)}")
+    print(f"할인 + 세금 포함: {batch.totals_with_tax(0.2)}")
+    
+    # 개별 함수 호출 결과와 완전히 같다
+    expected = [calculate_tax(calculate_total(apply_discount_safe(c, 0.2))) for c in carts]
+    print(f"개별 계산 결과와 일치: {batch.totals_with_tax(0.2) == expected}")
+    
+    print("\n" + "=" * 50)
+    print("6. 대량 처리: 스트리밍 총액 계산")
+    print("=" * 50)
+    
+    # 파일처럼 조금씩 읽히는 가격 피드 (줄바꿈/쉼표 구분)
+    feed = io.BytesIO(b"10000\n25000,15000\n8000\n")
+    partial = calculate_total_stream(feed, chunk_size=8)
+    print(f"\n스트리밍 총액: {partial.total:,}원 ({partial.count}개, {partial.offset}바이트)")
+    
+    # 체크포인트부터 재개: 피드에 새 가격이 추가된 경우
+    feed = io.BytesIO(b"10000\n25000,15000\n8000\n12000\n")
+    resumed = calculate_total_stream(feed, chunk_size=8, checkpoint=partial)
+    print(f"재개 후 총액: {resumed.total:,}원 ({resumed.count}개, 이번에 {resumed.processed}개)")
+    
+    print("\n" + "=" * 50)
+    print("7. 대량 처리: 누적 합계를 유지하는 Cart")
+    print("=" * 50)
+    
+    cart = Cart(discount_rate=0.2)
+    laptop = cart.add(10000)
+    mouse = cart.add(25000)
+    cart.add(15000)
+    print(f"\n상품: {cart.prices()} → 합계 {cart.subtotal:,}원")
+    
+    cart.change_price(laptop, 12000)
+    cart.remove(mouse)
+    print(f"변경 후: {cart.prices()} → 합계 {cart.subtotal:,}원")
+    print(f"할인 후: {cart.discounted_subtotal:,.0f}원, 세금 포함: {cart.total:,.0f}원")
+    
+    cart.undo()  # 삭제 취소
+    cart.undo()  # 가격 변경 취소
+    print(f"되돌린 후: {cart.prices()} → 합계 {cart.subtotal:,}원")
+    print(f"calculate_total과 일치: {cart.subtotal == calculate_total(cart.prices())}")
+    
+    print("\n" + "=" * 50)
+    print("8. 대량 처리: 복사 없는 할인 뷰")
+    print("=" * 50)
+    
+    cart3 = [10000, 25000, 15000]
+    view = DiscountedView(cart3, 0.2)
+    print(f"\n{view}")
+    print(f"첫 상품: {view[0]}, 전체: {list(view)}, 합계: {view.total():,.0f}원")
+    
+    # 할인 겹치기: 20% 할인 후 추가 10% 할인
+    stacked = view.discount(0.1)
+    print(f"{stacked}: {stacked.materialize()}")
+    print(f"원본 유지: {cart3}")
+    
+    print("\n" + "=" * 50)
+    print("9. 대량 처리: 카테고리별 할인/세금 규칙 엔진")
+    print("=" * 50)
+    
+    rules = {
+        "category_discounts": {"전자제품": 0.1},
+        "thresholds": [(50000, 0.05), (100000, 0.1)],
+        "max_discount": 20000,
+        "tax_rates": {"식품": 0.0},
+        "default_tax_rate": 0.1,
+    }
+    items = [("전자제품", 150000), ("식품", 12000), ("의류", 60000)]
+    engine = PricingRules(rules)
+    print(f"\n상품: {items}")
+    print(f"최종 가격: {engine.apply(items)}")
+    print(f"총액: {engine.total(items):,.0f}원")
+    
+    naive_seconds, compiled_seconds = benchmark_pricing_rules(20000)
+    print(f"상품 2만 개: 해석 {naive_seconds * 1000:.1f}ms, 규칙 엔진 {compiled_seconds * 1000:.1f}ms")
+    
+    print("\n" + "=" * 50)
+    print("10. 대량 처리: 샤딩된 카운터")
+    print("=" * 50)
+    
+    counter = ShardedCounter()
+    workers = [
+        threading.Thread(target=lambda: [counter.increment() for _ in range(1000)])
+        for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    print(f"\n스레드 4개 × 1000번: {counter.snapshot()}")
+    print(f"프로세스 4개 × 1000번 (공유 메모리): {count_with_processes(4, 1000)}")
+    
+    locked_seconds, sharded_seconds = benchmark_counters(4, 50000)
+    print(f"스레드 4개 × 5만 번: 락 {locked_seconds * 1000:.1f}ms, 샤딩 {sharded_seconds * 1000:.1f}ms")
+    
+    print("\n" + "=" * 50)
+    print("11. 대량 처리: 프로세스 풀 할인 파이프라인")
+    print("=" * 50)
+    
+    carts = [[10000, 25000, 15000], [8000], [], [12000, 30000]]
+    batch = CartBatch(carts)
+    # 예제 데이터는 작으므로 min_parallel=0으로 병렬 경로를 강제한다
+    discounted = bulk_apply_discount(batch, 0.2, workers=2, min_parallel=0)
+    offsets = batch.offsets
+    per_cart = [discounted[offsets[i]:offsets[i + 1]].tolist() for i in range(len(batch))]
+    print(f"\n20% 할인 (프로세스 2개): {per_cart}")
+    print(f"apply_discount_safe와 일치: {per_cart == [apply_discount_safe(c, 0.2) for c in carts]}")
+    
+    for size, serial_seconds, parallel_seconds in benchmark_bulk_discount((100000,), workers=2):
+        print(f"상품 {size:,}개: 현재 프로세스 {serial_seconds:.3f}초, 프로세스 풀 {parallel_seconds:.3f}초")
+    
     print("\n" + "=" * 50)
     print("학습 완료!")
     print("=" * 50)
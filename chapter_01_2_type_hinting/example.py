@@ -3,7 +3,24 @@ Chapter 1-2: Type Hinting (Annotation) 기초
 파이썬에서 타입을 명시하는 방법을 학습한다.
 """
 
-from typing import List, Dict, Tuple, Optional, Union
+import csv
+import functools
+import io
+import math
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+import types
+from array import array
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, BinaryIO, Callable, Deque, Iterable, Iterator, List, Dict, Tuple, Optional, Union
+from typing import get_args, get_origin, get_type_hints
 
 
 # ========================================
@@ -246,6 +263,1016 @@ def format_student_info(student: StudentInfo) -> str:
     return f"{name}: 수학={math}, 영어={english}, 과학={science}, 평균={avg:.1f}"
 
 
+# ========================================
+# 4. 대량 처리: 열 단위 성적 저장소
+# ========================================
+
+class StudentGradeStore:
+    """
+    학생 정보를 열(column) 단위로 저장하는 성적 저장소
+
+    학생마다 튜플을 두는 대신 이름 리스트 하나와
+    과목별 정수 배열(array)을 하나씩 둔다.
+    평균 열은 학생이 추가될 때 한 번만 계산하고,
+    모든 조회는 이 평균 열을 그대로 사용한다.
+    """
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.math: "array[int]" = array("i")
+        self.english: "array[int]" = array("i")
+        self.science: "array[int]" = array("i")
+        self.averages: List[float] = []
+
+    @classmethod
+    def from_students(cls, students: List[StudentInfo]) -> "StudentGradeStore":
+        """
+        학생 정보 리스트로 저장소를 만든다
+
+        Args:
+            students: 학생 정보 리스트
+
+        Returns:
+            StudentGradeStore 인스턴스
+        """
+        store = cls()
+        store.extend(students)
+        return store
+
+    def extend(self, students: List[StudentInfo]) -> None:
+        """
+        학생들을 추가하고 추가된 학생의 평균만 계산한다
+
+        Args:
+            students: 학생 정보 리스트
+        """
+        start: int = len(self.names)
+        for name, math, english, science in students:
+            self.names.append(name)
+            self.math.append(math)
+            self.english.append(english)
+            self.science.append(science)
+        self.averages.extend(
+            (math + english + science) / 3
+            for math, english, science in zip(
+                self.math[start:], self.english[start:], self.science[start:]
+            )
+        )
+
+    def to_students(self) -> List[StudentInfo]:
+        """
+        학생 정보 리스트로 되돌린다
+
+        Returns:
+            학생 정보 리스트
+        """
+        return list(zip(self.names, self.math, self.english, self.science))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def all_averages(self) -> Dict[str, float]:
+        """모든 학생의 평균 점수를 반환한다 (calculate_all_averages와 동일)"""
+        return dict(zip(self.names, self.averages))
+
+    def top_student(self) -> Optional[StudentInfo]:
+        """최고 평균 점수 학생을 반환한다 (find_top_student와 동일)"""
+        if not self.names:
+            return None
+        # 동점이면 max는 먼저 나온 학생을 고른다
+        i: int = max(range(len(self.averages)), key=self.averages.__getitem__)
+        return (self.names[i], self.math[i], self.english[i], self.science[i])
+
+    def above_threshold(self, threshold: float) -> List[str]:
+        """기준 점수 이상인 학생 이름을 반환한다 (get_students_above_threshold와 동일)"""
+        return [
+            name
+            for name, avg in zip(self.names, self.averages)
+            if avg >= threshold
+        ]
+
+
+# ========================================
+# 5. 대량 처리: 실시간 상위 k명 리더보드
+# ========================================
+
+class Leaderboard:
+    """
+    학생이 들어오는 대로 평균 순위를 유지하는 리더보드
+
+    (-평균, 등록 순서) 키를 정렬된 리스트로 유지하고 bisect로 위치를 찾는다.
+    - 상위 k명 조회: O(k)
+    - 학생 순위 조회: O(log n)
+    - 추가/점수 변경/삭제: O(log n) 탐색 + 리스트 삽입/삭제
+    평균이 같으면 먼저 등록된 학생이 앞선다.
+    점수가 바뀌어도 등록 순서는 유지되므로
+    top(1)은 같은 순서의 리스트에 대한 find_top_student와 같다.
+    학생은 이름으로 구분한다.
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[Tuple[float, int]] = []  # 오름차순 = 평균 내림차순
+        self._students: List[StudentInfo] = []  # _keys와 같은 순서
+        self._key_by_name: Dict[str, Tuple[float, int]] = {}
+        self._next_seq: int = 0
+
+    def _insert(self, key: Tuple[float, int], student: StudentInfo) -> None:
+        i: int = bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._students.insert(i, student)
+
+    def _delete(self, key: Tuple[float, int]) -> None:
+        i: int = bisect_left(self._keys, key)
+        del self._keys[i]
+        del self._students[i]
+
+    def push(self, student: StudentInfo) -> None:
+        """
+        학생을 추가하거나, 이미 있으면 점수를 갱신한다
+
+        Args:
+            student: 학생 정보
+        """
+        name: str = student[0]
+        old_key: Optional[Tuple[float, int]] = self._key_by_name.get(name)
+        if old_key is None:
+            seq: int = self._next_seq
+            self._next_seq += 1
+        else:
+            seq = old_key[1]
+            self._delete(old_key)
+        key: Tuple[float, int] = (-calculate_average(student), seq)
+        self._insert(key, student)
+        self._key_by_name[name] = key
+
+    def remove(self, name: str) -> bool:
+        """
+        학생을 삭제한다
+
+        Args:
+            name: 학생 이름
+
+        Returns:
+            삭제했으면 True, 없는 학생이면 False
+        """
+        key: Optional[Tuple[float, int]] = self._key_by_name.pop(name, None)
+        if key is None:
+            return False
+        self._delete(key)
+        return True
+
+    def top(self, k: int) -> List[StudentInfo]:
+        """
+        평균이 높은 순서로 상위 k명을 반환한다
+
+        Args:
+            k: 인원 수
+
+        Returns:
+            학생 정보 리스트
+        """
+        return self._students[:k]
+
+    def rank(self, name: str) -> Optional[int]:
+        """
+        학생의 순위를 반환한다 (1등부터)
+
+        Args:
+            name: 학생 이름
+
+        Returns:
+            순위 또는 None (없는 학생인 경우)
+        """
+        key: Optional[Tuple[float, int]] = self._key_by_name.get(name)
+        if key is None:
+            return None
+        return bisect_left(self._keys, key) + 1
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+# ========================================
+# 6. 대량 처리: 평균 점수 정렬 인덱스
+# ========================================
+
+class AverageIndex(Leaderboard):
+    """
+    평균 점수로 정렬된 인덱스 - 기준 점수/구간/백분위 조회
+
+    Leaderboard의 정렬된 키를 그대로 사용하므로
+    학생 추가와 점수 변경은 push()로 바로 반영된다.
+    조회는 bisect로 경계를 찾은 뒤 결과만 잘라내므로 O(log n + k)다.
+    결과 이름은 평균이 높은 순서로 나온다.
+    """
+
+    def count_above(self, threshold: float) -> int:
+        """
+        기준 점수 이상인 학생 수를 반환한다 (O(log n))
+
+        Args:
+            threshold: 기준 점수
+        """
+        # 등록 순서는 항상 _next_seq보다 작으므로 같은 평균 중 맨 뒤를 가리킨다
+        return bisect_left(self._keys, (-threshold, self._next_seq))
+
+    def above(self, threshold: float) -> List[str]:
+        """
+        기준 점수 이상인 학생 이름을 반환한다
+
+        get_students_above_threshold와 같은 학생들이지만 평균 내림차순이다.
+
+        Args:
+            threshold: 기준 점수
+
+        Returns:
+            학생 이름 리스트
+        """
+        end: int = self.count_above(threshold)
+        return [student[0] for student in self._students[:end]]
+
+    def between(self, low: float, high: float) -> List[str]:
+        """
+        평균이 low 이상 high 이하인 학생 이름을 반환한다
+
+        Args:
+            low: 최소 점수
+            high: 최대 점수
+
+        Returns:
+            학생 이름 리스트 (평균 내림차순)
+        """
+        start: int = bisect_left(self._keys, (-high, -1))
+        end: int = self.count_above(low)
+        return [student[0] for student in self._students[start:end]]
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        평균 점수의 백분위 값을 반환한다 (nearest-rank 방식)
+
+        Args:
+            percent: 백분위 (0 ~ 100, 50이면 중앙값)
+
+        Returns:
+            해당 백분위의 평균 점수 또는 None (학생이 없는 경우)
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("percent는 0 이상 100 이하여야 한다")
+        n: int = len(self._keys)
+        if n == 0:
+            return None
+        rank: int = max(1, math.ceil(percent / 100 * n))  # 오름차순 순위
+        return -self._keys[n - rank][0]
+
+
+# ========================================
+# 7. 대량 처리: 평균 점수 캐시
+# ========================================
+
+class AverageCache:
+    """
+    학생별 평균 점수를 기억해 두는 캐시
+
+    학생 이름을 키로 (학생 정보, 평균)을 저장한다.
+    같은 학생 정보로 다시 조회하면 저장된 평균을 돌려주고(hit),
+    점수가 바뀐 학생 정보가 들어오면 그 학생만 다시 계산한다(miss).
+    보고서 함수 네 개를 이 캐시로 실행하면
+    학생마다 평균 계산은 한 번만 일어난다.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[StudentInfo, float]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def average(self, student: StudentInfo) -> float:
+        """
+        학생의 평균 점수를 반환한다 (calculate_average와 동일)
+
+        Args:
+            student: 학생 정보
+
+        Returns:
+            평균 점수
+        """
+        entry: Optional[Tuple[StudentInfo, float]] = self._entries.get(student[0])
+        if entry is not None and (entry[0] is student or entry[0] == student):
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        avg: float = calculate_average(student)
+        self._entries[student[0]] = (student, avg)
+        return avg
+
+    def invalidate(self, name: str) -> None:
+        """
+        학생 한 명의 캐시를 지운다
+
+        Args:
+            name: 학생 이름
+        """
+        self._entries.pop(name, None)
+
+    @property
+    def hit_ratio(self) -> float:
+        """전체 조회 중 캐시에서 바로 돌려준 비율"""
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def all_averages(self, students: List[StudentInfo]) -> Dict[str, float]:
+        """calculate_all_averages와 같지만 캐시를 사용한다"""
+        return {student[0]: self.average(student) for student in students}
+
+    def top_student(self, students: List[StudentInfo]) -> Optional[StudentInfo]:
+        """find_top_student와 같지만 캐시를 사용한다"""
+        if not students:
+            return None
+        top: StudentInfo = students[0]
+        top_average: float = self.average(top)
+        for student in students[1:]:
+            avg: float = self.average(student)
+            if avg > top_average:
+                top = student
+                top_average = avg
+        return top
+
+    def above_threshold(self, students: List[StudentInfo], threshold: float) -> List[str]:
+        """get_students_above_threshold와 같지만 캐시를 사용한다"""
+        return [student[0] for student in students if self.average(student) >= threshold]
+
+    def format(self, student: StudentInfo) -> str:
+        """format_student_info와 같지만 캐시를 사용한다"""
+        name, math, english, science = student
+        avg: float = self.average(student)
+        return f"{name}: 수학={math}, 영어={english}, 과학={science}, 평균={avg:.1f}"
+
+
+# ========================================
+# 8. 대량 처리: 성적 파일 병렬 읽기
+# ========================================
+
+# 파싱에 실패한 행: (파일 내 바이트 오프셋, 행 내용)
+RowError = Tuple[int, str]
+
+# 한 번에 돌려주는 묶음: (학생 정보 리스트, 실패한 행 리스트)
+IngestBatch = Tuple[List[StudentInfo], List[RowError]]
+
+
+def parse_student_chunk(data: bytes, base_offset: int = 0) -> IngestBatch:
+    """
+    "이름,수학,영어,과학" 형식의 행들을 학생 정보로 변환한다
+
+    Args:
+        data: 줄 경계에서 잘린 바이트 묶음
+        base_offset: data가 파일에서 시작하는 바이트 위치
+
+    Returns:
+        (학생 정보 리스트, 실패한 행 리스트)
+    """
+    records: List[StudentInfo] = []
+    errors: List[RowError] = []
+    offset: int = base_offset
+    for line in data.split(b"\n"):
+        row: bytes = line.strip()
+        if row:
+            fields: List[bytes] = row.split(b",")
+            try:
+                if len(fields) != 4:
+                    raise ValueError(row)
+                records.append(create_student(
+                    fields[0].decode("utf-8").strip(),
+                    int(fields[1]),
+                    int(fields[2]),
+                    int(fields[3]),
+                ))
+            except ValueError:
+                errors.append((offset, line.decode("utf-8", "replace")))
+        offset += len(line) + 1
+    return records, errors
+
+
+def _read_line_chunks(file: BinaryIO, chunk_size: int) -> Iterator[Tuple[int, bytes]]:
+    """
+    파일을 chunk_size씩 읽어 마지막 줄바꿈에서 자른 묶음을 돌려준다
+
+    Returns:
+        (시작 바이트 오프셋, 묶음) 이터레이터
+    """
+    offset: int = 0
+    carry: bytes = b""
+    while True:
+        block: bytes = file.read(chunk_size)
+        if not block:
+            if carry:
+                yield offset, carry
+            return
+        data: bytes = carry + block
+        cut: int = data.rfind(b"\n") + 1
+        if cut == 0:  # 한 줄이 chunk_size보다 길면 더 읽는다
+            carry = data
+            continue
+        yield offset, data[:cut]
+        offset += cut
+        carry = data[cut:]
+
+
+def ingest_student_file(
+    path: str,
+    chunk_size: int = 1 << 20,
+    workers: Optional[int] = None
+) -> Iterator[IngestBatch]:
+    """
+    성적 파일을 묶음 단위로 읽어 여러 프로세스에서 파싱한다
+
+    파일은 chunk_size 바이트씩 읽고 줄 경계에서 잘라 워커에게 넘긴다.
+    동시에 처리 중인 묶음은 워커 수의 두 배로 제한하므로
+    파일 크기와 관계없이 메모리 사용량이 일정하다.
+    결과 묶음은 파일 순서대로 돌려준다.
+
+    Args:
+        path: 파일 경로 (한 줄에 "이름,수학,영어,과학")
+        chunk_size: 한 번에 읽을 바이트 수
+        workers: 워커 프로세스 수 (None이면 CPU 개수, 0이면 현재 프로세스에서 처리)
+
+    Returns:
+        (학생 정보 리스트, 실패한 행 리스트) 묶음 이터레이터
+    """
+    with open(path, "rb") as file:
+        chunks: Iterator[Tuple[int, bytes]] = _read_line_chunks(file, chunk_size)
+        if workers == 0:
+            for offset, data in chunks:
+                yield parse_student_chunk(data, offset)
+            return
+
+        max_workers: int = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending: Deque["Future[IngestBatch]"] = deque()
+            for offset, data in chunks:
+                pending.append(executor.submit(parse_student_chunk, data, offset))
+                if len(pending) >= max_workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+# ========================================
+# 9. 대량 처리: 메모리 맵 학생 ID 인덱스
+# ========================================
+
+# 인덱스 파일 구조 (정수는 현재 시스템의 바이트 순서)
+# [헤더 16바이트: b"SIDX" + 4바이트 패딩 + 학생 수 n]
+# [정렬된 학생 ID n개 (int64)]
+# [이름 시작 위치 n + 1개 (uint64, 이름 영역 기준)]
+# [이름 영역: UTF-8 이름들을 이어 붙인 것]
+_INDEX_HEADER = struct.Struct("=4s4xQ")
+_INDEX_MAGIC = b"SIDX"
+
+
+def build_student_index(path: str, students: Dict[int, str]) -> None:
+    """
+    {학생ID: 학생명} 딕셔너리를 인덱스 파일로 저장한다
+
+    Args:
+        path: 저장할 파일 경로
+        students: {학생ID: 학생명} 딕셔너리
+    """
+    ids: List[int] = sorted(students)
+    names: List[bytes] = [students[student_id].encode("utf-8") for student_id in ids]
+    offsets: "array[int]" = array("Q", [0])
+    for encoded in names:
+        offsets.append(offsets[-1] + len(encoded))
+    with open(path, "wb") as file:
+        file.write(_INDEX_HEADER.pack(_INDEX_MAGIC, len(ids)))
+        file.write(array("q", ids).tobytes())
+        file.write(offsets.tobytes())
+        file.write(b"".join(names))
+
+
+class StudentIndex:
+    """
+    인덱스 파일을 메모리 맵으로 열어 학생 이름을 찾는다
+
+    파일 내용을 읽어 딕셔너리를 만들지 않으므로 바로 열린다.
+    여러 프로세스가 같은 파일을 열면 운영체제 페이지 캐시를 함께 쓴다.
+    정렬된 ID 배열에서 bisect로 찾으므로 조회는 O(log n)이다.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path: build_student_index로 만든 파일 경로
+        """
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = _INDEX_HEADER.unpack_from(self._map)
+        if magic != _INDEX_MAGIC:
+            self.close()
+            raise ValueError(f"학생 인덱스 파일이 아니다: {path}")
+        self._count: int = count
+        ids_start: int = _INDEX_HEADER.size
+        offsets_start: int = ids_start + count * 8
+        self._heap_start: int = offsets_start + (count + 1) * 8
+        view = memoryview(self._map)
+        self._ids = view[ids_start:offsets_start].cast("q")
+        self._offsets = view[offsets_start:self._heap_start].cast("Q")
+        view.release()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _name_at(self, i: int) -> str:
+        start: int = self._heap_start + self._offsets[i]
+        end: int = self._heap_start + self._offsets[i + 1]
+        return self._map[start:end].decode("utf-8")
+
+    def find(self, student_id: int) -> Optional[str]:
+        """
+        학생 ID로 학생 이름을 찾는다 (find_student와 동일)
+
+        Args:
+            student_id: 학생 ID
+
+        Returns:
+            학생 이름 또는 None (찾지 못한 경우)
+        """
+        i: int = bisect_left(self._ids, student_id)
+        if i < self._count and self._ids[i] == student_id:
+            return self._name_at(i)
+        return None
+
+    def find_many(self, student_ids: List[int]) -> List[Optional[str]]:
+        """
+        여러 학생 ID를 한 번에 찾는다
+
+        ID를 정렬해 두고 앞에서 찾은 위치부터 다음 ID를 찾으므로
+        탐색 범위가 점점 줄어든다.
+
+        Args:
+            student_ids: 학생 ID 리스트
+
+        Returns:
+            입력 순서대로의 학생 이름 또는 None 리스트
+        """
+        result: List[Optional[str]] = [None] * len(student_ids)
+        ids = self._ids
+        low: int = 0
+        for position in sorted(range(len(student_ids)), key=student_ids.__getitem__):
+            student_id: int = student_ids[position]
+            low = bisect_left(ids, student_id, low)
+            if low < self._count and ids[low] == student_id:
+                result[position] = self._name_at(low)
+        return result
+
+    def close(self) -> None:
+        """메모리 맵과 파일을 닫는다"""
+        for view_name in ("_ids", "_offsets"):
+            view = getattr(self, view_name, None)
+            if view is not None:
+                view.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "StudentIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+# ========================================
+# 10. 대량 처리: 타입 힌트로 만드는 검증 함수
+# ========================================
+
+# 값을 받아 타입에 맞으면 True를 반환하는 함수
+Validator = Callable[[object], bool]
+
+
+def check_type(value: object, tp: Any) -> bool:
+    """
+    값이 타입 힌트에 맞는지 재귀적으로 검사한다 (범용 검사기)
+
+    매번 타입 힌트를 해석하므로 느리다. compile_validator와 비교하는 기준이다.
+    float 자리에는 int도 허용한다 (타입 힌트 규칙과 같다).
+
+    Args:
+        value: 검사할 값
+        tp: 타입 힌트 (int, List[int], Optional[str], StudentInfo 등)
+
+    Returns:
+        타입에 맞으면 True
+    """
+    if tp is Any or tp is object:
+        return True
+    if tp is None or tp is type(None):
+        return value is None
+    origin: Any = get_origin(tp)
+    args: Tuple[Any, ...] = get_args(tp)
+    if origin is Union or origin is types.UnionType:
+        return any(check_type(value, arg) for arg in args)
+    if origin is list:
+        return isinstance(value, list) and all(check_type(item, args[0]) for item in value)
+    if origin is dict:
+        return isinstance(value, dict) and all(
+            check_type(key, args[0]) and check_type(item, args[1])
+            for key, item in value.items()
+        )
+    if origin is tuple:
+        if not isinstance(value, tuple):
+            return False
+        if len(args) == 2 and args[1] is Ellipsis:
+            return all(check_type(item, args[0]) for item in value)
+        return len(value) == len(args) and all(
+            check_type(item, arg) for item, arg in zip(value, args)
+        )
+    if tp is float:
+        return isinstance(value, (int, float))
+    if isinstance(tp, type):
+        return isinstance(value, tp)
+    raise TypeError(f"지원하지 않는 타입 힌트: {tp!r}")
+
+
+def _check_source(tp: Any, var: str, env: Dict[str, Any], depth: int) -> str:
+    """타입 힌트를 var를 검사하는 파이썬 식(문자열)으로 바꾼다"""
+    if tp is Any or tp is object:
+        return "True"
+    if tp is None or tp is type(None):
+        return f"{var} is None"
+    origin: Any = get_origin(tp)
+    args: Tuple[Any, ...] = get_args(tp)
+    item: str = f"_x{depth}"
+    if origin is Union or origin is types.UnionType:
+        return "(" + " or ".join(_check_source(arg, var, env, depth) for arg in args) + ")"
+    if origin is list:
+        inner: str = _check_source(args[0], item, env, depth + 1) if args else "True"
+        if inner == "True":
+            return f"isinstance({var}, list)"
+        return f"(isinstance({var}, list) and all({inner} for {item} in {var}))"
+    if origin is dict:
+        key: str = f"_k{depth}"
+        key_check: str = _check_source(args[0], key, env, depth + 1) if args else "True"
+        item_check: str = _check_source(args[1], item, env, depth + 1) if args else "True"
+        if key_check == item_check == "True":
+            return f"isinstance({var}, dict)"
+        return (
+            f"(isinstance({var}, dict) and all({key_check} and {item_check} "
+            f"for {key}, {item} in {var}.items()))"
+        )
+    if origin is tuple:
+        if not args:
+            return f"isinstance({var}, tuple)"
+        if len(args) == 2 and args[1] is Ellipsis:
+            inner = _check_source(args[0], item, env, depth + 1)
+            return f"(isinstance({var}, tuple) and all({inner} for {item} in {var}))"
+        # 고정 길이 튜플은 칸마다 검사식을 풀어 쓴다
+        parts: List[str] = [f"isinstance({var}, tuple)", f"len({var}) == {len(args)}"]
+        parts.extend(
+            _check_source(arg, f"{var}[{i}]", env, depth) for i, arg in enumerate(args)
+        )
+        return "(" + " and ".join(parts) + ")"
+    if tp is float:
+        return f"isinstance({var}, (int, float))"
+    if isinstance(tp, type):
+        name: str = f"_T{len(env)}"
+        env[name] = tp
+        return f"isinstance({var}, {name})"
+    raise TypeError(f"지원하지 않는 타입 힌트: {tp!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def compile_validator(tp: Any) -> Validator:
+    """
+    타입 힌트 전용 검증 함수를 만든다 (타입마다 한 번만 만들고 재사용)
+
+    타입 힌트를 검사식 하나로 풀어 쓴 함수를 생성한다.
+    예: StudentInfo → isinstance(v, tuple) and len(v) == 4 and isinstance(v[0], str) ...
+    결과는 check_type(value, tp)와 같다.
+
+    Args:
+        tp: 타입 힌트
+
+    Returns:
+        검증 함수
+    """
+    env: Dict[str, Any] = {}
+    source: str = f"def check(value):\n    return {_check_source(tp, 'value', env, 0)}\n"
+    exec(source, env)
+    check: Validator = env["check"]
+    return check
+
+
+def validators_for(func: Callable[..., Any]) -> Dict[str, Validator]:
+    """
+    함수의 타입 힌트를 읽어 매개변수별 검증 함수를 만든다
+
+    Args:
+        func: 타입 힌트가 있는 함수
+
+    Returns:
+        {매개변수명: 검증 함수} 딕셔너리 (반환값은 "return")
+    """
+    return {name: compile_validator(tp) for name, tp in get_type_hints(func).items()}
+
+
+def validate_batch(records: List[Any], tp: Any) -> List[int]:
+    """
+    레코드 묶음을 한 번에 검증한다
+
+    Args:
+        records: 검사할 값 리스트
+        tp: 각 값의 타입 힌트
+
+    Returns:
+        타입에 맞지 않는 레코드의 위치 리스트
+    """
+    check: Validator = compile_validator(tp)
+    return [i for i, valid in enumerate(map(check, records)) if not valid]
+
+
+def benchmark_validators(n: int = 100000) -> Tuple[float, float]:
+    """
+    범용 검사기와 생성된 검증 함수로 학생 정보 n개를 검증하는 시간을 비교한다
+
+    Args:
+        n: 레코드 수
+
+    Returns:
+        (범용 검사기 소요 시간, 생성된 검증 함수 소요 시간) 초 단위
+    """
+    records: List[Any] = [create_student(f"학생{i}", i % 101, 50, 70) for i in range(n)]
+    records[n // 2] = ("잘못된", "90", 80, 70)
+
+    started: float = time.perf_counter()
+    generic: List[int] = [i for i, record in enumerate(records) if not check_type(record, StudentInfo)]
+    generic_seconds: float = time.perf_counter() - started
+
+    started = time.perf_counter()
+    compiled: List[int] = validate_batch(records, StudentInfo)
+    compiled_seconds: float = time.perf_counter() - started
+
+    if generic != compiled:
+        raise AssertionError("검증 결과가 다르다")
+    return generic_seconds, compiled_seconds
+
+
+# ========================================
+# 11. 대량 처리: 한 번에 계산하는 점수 통계
+# ========================================
+
+class ScoreStats:
+    """
+    점수를 한 번씩만 보고 통계를 누적하는 계산기
+
+    - 평균/분산: Welford 알고리즘 (값을 저장하지 않는다)
+    - 최솟값/최댓값
+    - 분위수/히스토그램: bin_width 간격의 구간별 개수
+      (점수 범위가 0~100이면 구간은 최대 101개로 메모리가 일정하다)
+    정수 점수에 bin_width=1이면 분위수는 정확하고,
+    그 외에는 오차가 bin_width 이내다.
+    여러 워커가 따로 누적한 결과는 merge()로 합칠 수 있다.
+    """
+
+    def __init__(self, bin_width: int = 1) -> None:
+        """
+        Args:
+            bin_width: 히스토그램 구간 너비 (기본값 1)
+        """
+        self.bin_width: int = bin_width
+        self.count: int = 0
+        self.mean: float = 0.0
+        self._m2: float = 0.0  # 평균과의 차이 제곱합
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+        self.bins: Dict[int, int] = {}
+
+    def add(self, score: float) -> None:
+        """
+        점수 하나를 누적한다
+
+        Args:
+            score: 점수
+        """
+        self.count += 1
+        delta: float = score - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (score - self.mean)
+        if self.minimum is None or score < self.minimum:
+            self.minimum = score
+        if self.maximum is None or score > self.maximum:
+            self.maximum = score
+        key: int = int(score // self.bin_width)
+        self.bins[key] = self.bins.get(key, 0) + 1
+
+    def merge(self, other: "ScoreStats") -> None:
+        """
+        다른 계산기의 결과를 합친다 (Chan의 병렬 분산 공식)
+
+        Args:
+            other: 같은 bin_width로 누적한 ScoreStats
+        """
+        if other.bin_width != self.bin_width:
+            raise ValueError("bin_width가 같은 통계만 합칠 수 있다")
+        if other.count == 0:
+            return
+        total: int = self.count + other.count
+        delta: float = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        if other.minimum is not None and (self.minimum is None or other.minimum < self.minimum):
+            self.minimum = other.minimum
+        if other.maximum is not None and (self.maximum is None or other.maximum > self.maximum):
+            self.maximum = other.maximum
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+
+    @property
+    def variance(self) -> float:
+        """모분산"""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """모표준편차"""
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        분위수를 반환한다 (nearest-rank 방식)
+
+        Args:
+            q: 0.0 ~ 1.0 (0.5면 중앙값, 0.9면 p90)
+
+        Returns:
+            해당 분위의 구간 시작 점수 또는 None (점수가 없는 경우)
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q는 0 이상 1 이하여야 한다")
+        if self.count == 0:
+            return None
+        target: int = max(1, math.ceil(q * self.count))
+        seen: int = 0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen >= target:
+                return key * self.bin_width
+        return None
+
+    def histogram(self) -> List[Tuple[int, int]]:
+        """(구간 시작 점수, 개수) 리스트를 점수 순서로 반환한다"""
+        return [(key * self.bin_width, self.bins[key]) for key in sorted(self.bins)]
+
+
+class RosterStats:
+    """과목별 ScoreStats를 묶어 학생 정보를 한 번에 누적한다"""
+
+    SUBJECTS: Tuple[str, str, str] = ("수학", "영어", "과학")
+
+    def __init__(self, bin_width: int = 1) -> None:
+        self.subjects: Dict[str, ScoreStats] = {
+            subject: ScoreStats(bin_width) for subject in self.SUBJECTS
+        }
+
+    def add(self, student: StudentInfo) -> None:
+        """학생 한 명의 과목 점수를 누적한다"""
+        name, math_score, english, science = student
+        self.subjects["수학"].add(math_score)
+        self.subjects["영어"].add(english)
+        self.subjects["과학"].add(science)
+
+    def add_all(self, students: List[StudentInfo]) -> None:
+        """학생 목록을 한 번 훑으며 누적한다"""
+        for student in students:
+            self.add(student)
+
+    def merge(self, other: "RosterStats") -> None:
+        """다른 RosterStats(예: 다른 워커의 결과)를 합친다"""
+        for subject, stats in other.subjects.items():
+            self.subjects[subject].merge(stats)
+
+
+# ========================================
+# 12. 대량 처리: 버퍼를 쓰는 성적 보고서 출력
+# ========================================
+
+class ReportStats:
+    """보고서 출력 결과 (레코드 수, 바이트 수, 소요 시간)
+
+    텍스트 파일에 쓴 경우 bytes_written은 쓴 문자 수다.
+    """
+
+    def __init__(self, records: int, bytes_written: int, elapsed: float) -> None:
+        self.records: int = records
+        self.bytes_written: int = bytes_written
+        self.elapsed: float = elapsed
+
+    @property
+    def records_per_second(self) -> float:
+        """초당 출력한 레코드 수"""
+        return self.records / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _format_text_batch(batch: List[StudentInfo]) -> str:
+    """format_student_info와 같은 형식으로 여러 줄을 한 번에 만든다"""
+    lines: List[str] = [
+        f"{name}: 수학={math}, 영어={english}, 과학={science}, "
+        f"평균={(math + english + science) / 3:.1f}"
+        for name, math, english, science in batch
+    ]
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _flush_report(
+    write: Callable[[Any], Any],
+    parts: List[str],
+    buffer: bytearray,
+    is_text: bool
+) -> int:
+    """모아 둔 보고서 조각을 한 번에 쓰고 비운 뒤 쓴 크기를 반환한다"""
+    if is_text:
+        text: str = "".join(parts)
+        write(text)
+        parts.clear()
+        return len(text)
+    write(buffer)
+    size: int = len(buffer)
+    buffer.clear()
+    return size
+
+
+def write_student_report(
+    students: Iterable[StudentInfo],
+    out: Any,
+    fmt: str = "text",
+    buffer_size: int = 1 << 16,
+    batch_size: int = 1024
+) -> ReportStats:
+    """
+    학생 보고서를 묶음 단위로 만들어 큰 블록으로 출력한다
+
+    batch_size명씩 문자열을 한 번에 만들고, buffer_size를 넘을 만큼 모이면 한 번에 쓴다.
+    바이너리 파일과 소켓에는 UTF-8로 인코딩해 재사용하는 버퍼에 모으고,
+    텍스트 파일에는 문자열을 그대로 써서 스트림의 인코딩과 줄바꿈 변환을 따른다.
+    text 형식은 format_student_info로 한 줄씩 print한 것과 같은 출력을 만든다.
+
+    Args:
+        students: 학생 정보 iterable
+        out: 바이너리 파일, 텍스트 파일(sys.stdout, io.StringIO 등) 또는 소켓
+        fmt: "text" 또는 "csv"
+        buffer_size: 한 번에 쓰는 최소 크기 (바이트, 텍스트 파일은 문자 수)
+        batch_size: 한 번에 문자열로 만드는 학생 수
+
+    Returns:
+        ReportStats (레코드 수, 바이트 수, 초당 레코드 수)
+    """
+    if fmt not in ("text", "csv"):
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+    # 텍스트 출력은 str을 그대로 써서 스트림의 인코딩과 줄바꿈 변환을 따른다
+    is_text: bool = isinstance(out, io.TextIOBase)
+    write: Callable[[Any], Any] = getattr(out, "sendall", None) or out.write
+
+    started: float = time.perf_counter()
+    buffer: bytearray = bytearray()
+    parts: List[str] = []
+    pending: int = 0
+    records: int = 0
+    written: int = 0
+    csv_text: io.StringIO = io.StringIO()
+    csv_writer = csv.writer(csv_text, lineterminator="\n")
+    if fmt == "csv":
+        csv_writer.writerow(["이름", "수학", "영어", "과학", "평균"])
+
+    iterator: Iterator[StudentInfo] = iter(students)
+    while True:
+        batch: List[StudentInfo] = list(islice(iterator, batch_size))
+        if not batch and not (fmt == "csv" and csv_text.tell()):
+            break  # 학생이 없어도 CSV 헤더는 한 번 쓴다
+        if fmt == "text":
+            chunk: str = _format_text_batch(batch)
+        else:
+            csv_writer.writerows(
+                (name, math, english, science, f"{(math + english + science) / 3:.1f}")
+                for name, math, english, science in batch
+            )
+            chunk = csv_text.getvalue()
+            csv_text.seek(0)
+            csv_text.truncate()
+        records += len(batch)
+        if is_text:
+            parts.append(chunk)
+            pending += len(chunk)
+        else:
+            buffer += chunk.encode("utf-8")
+            pending = len(buffer)
+        if pending >= buffer_size:
+            written += _flush_report(write, parts, buffer, is_text)
+            pending = 0
+
+    if pending:
+        written += _flush_report(write, parts, buffer, is_text)
+    return ReportStats(records, written, time.perf_counter() - started)
+
+
 # ========================================
 # 메인 실행
 # ========================================
@@ -345,6 +1372,141 @@ if __name__ == "__main__":
     for name in excellent_students:
         print(f"  - {name}")
     
+    print("\n" + "=" * 50)
+    print("4. 대량 처리: 열 단위 성적 저장소")
+    print("=" * 50)
+    
+    store: StudentGradeStore = StudentGradeStore.from_students(students)
+    print(f"\n저장소 학생 수: {len(store)}")
+    print(f"수학 열: {list(store.math)}")
+    print(f"평균 열: {[round(avg, 1) for avg in store.averages]}")
+    print(f"최고 점수 학생: {store.top_student()}")
+    print(f"평균 {threshold}점 이상: {store.above_threshold(threshold)}")
+    print(f"튜플 리스트로 복원: {store.to_students() == students}")
+    
+    print("\n" + "=" * 50)
+    print("5. 대량 처리: 실시간 상위 k명 리더보드")
+    print("=" * 50)
+    
+    board: Leaderboard = Leaderboard()
+    for student in students:
+        board.push(student)
+    print(f"\n상위 3명: {[s[0] for s in board.top(3)]}")
+    print(f"find_top_student와 일치: {board.top(1)[0] == find_top_student(students)}")
+    print(f"박민수 순위: {board.rank('박민수')}등")
+    
+    board.push(create_student("박민수", 99, 98, 100))  # 점수 갱신
+    print(f"점수 갱신 후 박민수 순위: {board.rank('박민수')}등")
+    board.remove("최지은")
+    print(f"최지은 삭제 후 상위 3명: {[s[0] for s in board.top(3)]}")
+    
+    print("\n" + "=" * 50)
+    print("6. 대량 처리: 평균 점수 정렬 인덱스")
+    print("=" * 50)
+    
+    index: AverageIndex = AverageIndex()
+    for student in students:
+        index.push(student)
+    print(f"\n평균 90점 이상: {index.above(90.0)} ({index.count_above(90.0)}명)")
+    print(f"평균 80~90점: {index.between(80.0, 90.0)}")
+    print(f"중앙값: {index.percentile(50):.1f}, 상위 10% 경계(p90): {index.percentile(90):.1f}")
+    
+    print("\n" + "=" * 50)
+    print("7. 대량 처리: 평균 점수 캐시")
+    print("=" * 50)
+    
+    cache: AverageCache = AverageCache()
+    report: List[str] = [cache.format(student) for student in students]
+    cache.all_averages(students)
+    cache.top_student(students)
+    cache.above_threshold(students, threshold)
+    print(f"\n보고서 {len(report)}줄 생성: 계산 {cache.misses}번, 캐시 사용 {cache.hits}번")
+    
+    # 한 학생의 점수만 바뀌면 그 학생만 다시 계산한다
+    students[0] = create_student("김철수", 90, 95, 92)
+    cache.all_averages(students)
+    print(f"김철수 점수 변경 후: 계산 {cache.misses}번, 캐시 적중률 {cache.hit_ratio:.0%}")
+    
+    print("\n" + "=" * 50)
+    print("8. 대량 처리: 성적 파일 병렬 읽기")
+    print("=" * 50)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        score_path: str = os.path.join(tmp_dir, "scores.csv")
+        with open(score_path, "w", encoding="utf-8") as score_file:
+            for student in students:
+                score_file.write(",".join(map(str, student)) + "\n")
+            score_file.write("잘못된행,100\n")
+        
+        loaded: List[StudentInfo] = []
+        for records, errors in ingest_student_file(score_path, chunk_size=64, workers=2):
+            loaded.extend(records)
+            for error_offset, line in errors:
+                print(f"\n잘못된 행 (오프셋 {error_offset}): {line!r}")
+        print(f"읽은 학생 수: {len(loaded)}, 원본과 일치: {loaded == students}")
+    
+    print("\n" + "=" * 50)
+    print("9. 대량 처리: 메모리 맵 학생 ID 인덱스")
+    print("=" * 50)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        index_path: str = os.path.join(tmp_dir, "students.idx")
+        build_student_index(index_path, student_db)
+        with StudentIndex(index_path) as student_index:
+            print(f"\n인덱스 학생 수: {len(student_index)}")
+            print(f"학생 ID 2: {student_index.find(2)}")
+            print(f"학생 ID 99: {student_index.find(99)}")
+            print(f"여러 ID 조회 [3, 99, 1]: {student_index.find_many([3, 99, 1])}")
+    
+    print("\n" + "=" * 50)
+    print("10. 대량 처리: 타입 힌트로 만드는 검증 함수")
+    print("=" * 50)
+    
+    validate_students: Validator = compile_validator(List[StudentInfo])
+    print(f"\nList[StudentInfo] 검증: {validate_students(students)}")
+    print(f"잘못된 점수 타입: {validate_students([('홍길동', '90', 80, 70)])}")
+    
+    find_student_checks: Dict[str, Validator] = validators_for(find_student)
+    print(f"find_student 반환값(Optional[str]) 검증: "
+          f"None → {find_student_checks['return'](None)}, 1 → {find_student_checks['return'](1)}")
+    print(f"잘못된 레코드 위치: {validate_batch([students[0], ('이름', 1, 2), students[1]], StudentInfo)}")
+    
+    generic_seconds, compiled_seconds = benchmark_validators(50000)
+    print(f"학생 정보 5만 개 검증: 범용 {generic_seconds * 1000:.1f}ms, 생성 함수 {compiled_seconds * 1000:.1f}ms")
+    
+    print("\n" + "=" * 50)
+    print("11. 대량 처리: 한 번에 계산하는 점수 통계")
+    print("=" * 50)
+    
+    # 두 워커가 학생을 나누어 누적한 뒤 합친다
+    first_half: RosterStats = RosterStats()
+    first_half.add_all(students[:2])
+    second_half: RosterStats = RosterStats()
+    second_half.add_all(students[2:])
+    first_half.merge(second_half)
+    
+    print()
+    for subject, stats in first_half.subjects.items():
+        print(f"{subject}: 평균={stats.mean:.1f}, 표준편차={stats.stdev:.1f}, "
+              f"최소={stats.minimum}, 최대={stats.maximum}, "
+              f"중앙값={stats.quantile(0.5)}, p90={stats.quantile(0.9)}, p99={stats.quantile(0.99)}")
+    
+    print("\n" + "=" * 50)
+    print("12. 대량 처리: 버퍼를 쓰는 성적 보고서 출력")
+    print("=" * 50)
+    
+    print()
+    write_student_report(students, sys.stdout, fmt="csv")
+    
+    report_buffer: io.BytesIO = io.BytesIO()
+    report_stats: ReportStats = write_student_report(students * 1000, report_buffer)
+    print(f"\ntext 형식 {report_stats.records}줄, {report_stats.bytes_written:,}바이트 출력 "
+          f"({report_stats.records_per_second:,.0f} records/s)")
+    expected_report: bytes = "".join(
+        format_student_info(student) + "\n" for student in students * 1000
+    ).encode("utf-8")
+    print(f"text 형식이 format_student_info와 같은가: {report_buffer.getvalue() == expected_report}")
+    
     print("\n" + "=" * 50)
     print("학습 완료!")
     print("타입 체크: mypy chapter_01_2_type_hinting/example.py")
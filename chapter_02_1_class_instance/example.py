@@ -3,6 +3,18 @@ Chapter 2-1: 클래스 정의와 인스턴스화
 클래스를 정의하고 객체를 생성하는 방법을 학습한다.
 """
 
+import heapq
+import sys
+import time
+import timeit
+import tracemalloc
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from itertools import chain, starmap
+from operator import itemgetter, mul
+from contextlib import redirect_stdout
+
 
 # ========================================
 # 1. 기본 클래스 정의
@@ -57,6 +69,47 @@ class Book:
         self.author = author
         self.pages = pages
         self.price = price
+    
+    @classmethod
+    def from_records(cls, records: Iterable[tuple[str, str, int, int]]) -> list["Book"]:
+        """
+        (제목, 저자, 페이지 수, 가격) 튜플들로 Book을 한꺼번에 만든다
+        
+        starmap이 생성자를 직접 호출한다.
+        __init__을 그대로 거치므로 하나씩 만든 것과 똑같고,
+        시간 대부분이 __init__에 쓰이므로 반복문보다 크게 빠르지는 않다.
+        
+        Args:
+            records: (title, author, pages, price) 튜플 iterable
+        
+        Returns:
+            Book 리스트
+        """
+        return list(starmap(cls, records))
+    
+    @classmethod
+    def from_columns(
+        cls,
+        titles: Iterable[str],
+        authors: Iterable[str],
+        pages: Iterable[int],
+        prices: Iterable[int]
+    ) -> list["Book"]:
+        """
+        열(column) 단위 데이터로 Book을 한꺼번에 만든다
+        
+        반복문으로 하나씩 만드는 것과 속도는 거의 같다 (시간 대부분이 __init__).
+        
+        Args:
+            titles: 제목 열
+            authors: 저자 열
+            pages: 페이지 수 열
+            prices: 가격 열
+        
+        Returns:
+            Book 리스트
+        """
+        return list(map(cls, titles, authors, pages, prices))
 
 
 # ========================================
@@ -156,6 +209,749 @@ class Product:
     def display(self) -> None:
         """상품 정보를 출력한다"""
         print(f"[{self.category}] {self.name}: {self.price:,}원 (재고: {self.quantity}개)")
+    
+    @classmethod
+    def from_records(cls, records: Iterable[tuple]) -> list["Product"]:
+        """
+        (상품명, 가격[, 수량[, 카테고리]]) 튜플들로 Product를 한꺼번에 만든다
+        
+        생략한 값에는 생성자의 기본값(quantity=0, category="기타")이 들어간다.
+        
+        Args:
+            records: 튜플 iterable
+        
+        Returns:
+            Product 리스트
+        """
+        return list(starmap(cls, records))
+    
+    @classmethod
+    def from_columns(
+        cls,
+        names: Iterable[str],
+        prices: Iterable[int],
+        quantities: Iterable[int] | None = None,
+        categories: Iterable[str] | None = None
+    ) -> list["Product"]:
+        """
+        열(column) 단위 데이터로 Product를 한꺼번에 만든다
+        
+        생략한 열에는 생성자의 기본값이 들어간다.
+        반복문으로 하나씩 만드는 것과 속도는 거의 같다 (시간 대부분이 __init__).
+        
+        Args:
+            names: 상품명 열
+            prices: 가격 열
+            quantities: 수량 열 (None이면 모두 기본값 0)
+            categories: 카테고리 열 (None이면 모두 기본값 "기타")
+        
+        Returns:
+            Product 리스트
+        """
+        if categories is None:
+            if quantities is None:
+                return list(map(cls, names, prices))
+            return list(map(cls, names, prices, quantities))
+        if quantities is None:
+            return [
+                cls(name, price, category=category)
+                for name, price, category in zip(names, prices, categories)
+            ]
+        return list(map(cls, names, prices, quantities, categories))
+
+
+# ========================================
+# 5. 대량 처리: __slots__로 인스턴스 메모리 줄이기
+# ========================================
+
+# __slots__를 선언하면 인스턴스마다 __dict__를 만들지 않고
+# 정해진 속성 칸만 가진다. 생성자와 메서드 동작은 원래 클래스와 같다.
+# 대신 선언하지 않은 속성은 새로 추가할 수 없다.
+
+class SlottedPerson:
+    """__slots__를 사용하는 Person"""
+    
+    __slots__ = ("name", "age")
+    
+    def __init__(self, name: str, age: int):
+        self.name = name
+        self.age = age
+        print(f"Person 객체 생성: {self.name} ({self.age}세)")
+
+
+class SlottedBook:
+    """__slots__를 사용하는 Book"""
+    
+    __slots__ = ("title", "author", "pages", "price")
+    
+    def __init__(self, title: str, author: str, pages: int, price: int):
+        self.title = title
+        self.author = author
+        self.pages = pages
+        self.price = price
+
+
+class SlottedPersonWithMethods:
+    """__slots__를 사용하는 PersonWithMethods"""
+    
+    __slots__ = ("name", "age", "email")
+    
+    def __init__(self, name: str, age: int, email: str):
+        self.name = name
+        self.age = age
+        self.email = email
+    
+    def greet(self) -> str:
+        """인사 메시지를 반환한다"""
+        return f"안녕하세요! 저는 {self.name}이고, {self.age}세입니다."
+    
+    def get_info(self) -> str:
+        """상세 정보를 반환한다"""
+        return f"이름: {self.name}, 나이: {self.age}, 이메일: {self.email}"
+    
+    def celebrate_birthday(self) -> None:
+        """나이를 1 증가시킨다 (생일 축하!)"""
+        self.age += 1
+        print(f"{self.name}님, 생일 축하합니다! 이제 {self.age}세입니다.")
+    
+    def update_email(self, new_email: str) -> None:
+        """이메일을 업데이트한다"""
+        old_email = self.email
+        self.email = new_email
+        print(f"이메일 변경: {old_email} → {new_email}")
+
+
+class SlottedProduct:
+    """__slots__를 사용하는 Product"""
+    
+    __slots__ = ("name", "price", "quantity", "category")
+    
+    def __init__(
+        self,
+        name: str,
+        price: int,
+        quantity: int = 0,
+        category: str = "기타"
+    ):
+        self.name = name
+        self.price = price
+        self.quantity = quantity
+        self.category = category
+    
+    def get_total_value(self) -> int:
+        """총 가치를 계산한다 (가격 × 수량)"""
+        return self.price * self.quantity
+    
+    def display(self) -> None:
+        """상품 정보를 출력한다"""
+        print(f"[{self.category}] {self.name}: {self.price:,}원 (재고: {self.quantity}개)")
+
+
+def _measure_class(cls: type, args: tuple, attribute: str, n: int) -> tuple[float, float, float]:
+    """
+    클래스 하나의 인스턴스당 메모리, 생성 시간, 속성 접근 시간을 잰다
+    
+    Returns:
+        (인스턴스당 바이트, 생성 시간(초), 속성 n번 읽기 시간(초))
+    """
+    with redirect_stdout(None):  # Person 생성자의 출력은 버린다
+        started = time.perf_counter()
+        objects = [cls(*args) for _ in range(n)]
+        construct_seconds = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        for obj in objects:
+            getattr(obj, attribute)
+        access_seconds = time.perf_counter() - started
+        del objects
+        
+        # 메모리는 추적 비용이 시간 측정에 섞이지 않도록 따로 잰다
+        tracemalloc.start()
+        objects = [cls(*args) for _ in range(n)]
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    return used / n, construct_seconds, access_seconds
+
+
+def benchmark_slots(n: int = 100000) -> list[tuple[str, float, float, float]]:
+    """
+    일반 클래스와 __slots__ 클래스의 메모리와 속도를 비교한다
+    
+    Args:
+        n: 클래스마다 만들 인스턴스 수
+    
+    Returns:
+        (클래스명, 인스턴스당 바이트, 생성 시간, 속성 접근 시간) 리스트
+    """
+    cases: list[tuple[type, tuple, str]] = [
+        (Person, ("김철수", 25), "age"),
+        (SlottedPerson, ("김철수", 25), "age"),
+        (Book, ("클린 코드", "로버트 C. 마틴", 584, 33000), "price"),
+        (SlottedBook, ("클린 코드", "로버트 C. 마틴", 584, 33000), "price"),
+        (PersonWithMethods, ("홍길동", 28, "hong@example.com"), "email"),
+        (SlottedPersonWithMethods, ("홍길동", 28, "hong@example.com"), "email"),
+        (Product, ("마우스", 30000, 10, "전자제품"), "price"),
+        (SlottedProduct, ("마우스", 30000, 10, "전자제품"), "price"),
+    ]
+    return [
+        (cls.__name__, *_measure_class(cls, args, attribute, n))
+        for cls, args, attribute in cases
+    ]
+
+
+# ========================================
+# 6. 대량 처리: 카테고리 + 가격 구간 상품 인덱스
+# ========================================
+
+class ProductCatalog:
+    """
+    Product를 카테고리와 가격으로 빠르게 찾는 카탈로그
+    
+    - 카테고리 해시 인덱스: {카테고리: 해당 카테고리 상품들}
+    - 카테고리별 가격 정렬 인덱스: (가격, 등록 순서) 정렬 리스트 + bisect
+    "전자제품 중 5만~20만원" 같은 조회는 O(log n + k)다.
+    카테고리별 총 가치(get_total_value의 합)는 변경될 때마다 갱신해 둔다.
+    
+    가격과 수량은 reprice(), update_quantity()로 바꿔야 인덱스에 반영된다.
+    """
+    
+    def __init__(self) -> None:
+        self._keys: dict[str, list[tuple[int, int]]] = {}  # 카테고리별 (가격, 등록 순서)
+        self._products: dict[str, list[Product]] = {}  # _keys와 같은 순서
+        self._entries: dict[int, tuple[str, tuple[int, int], int]] = {}  # id → (카테고리, 키, 가치)
+        self._values: dict[str, int] = {}
+        self._next_seq = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _insert(self, product: Product, seq: int) -> None:
+        category = product.category
+        key = (product.price, seq)
+        keys = self._keys.setdefault(category, [])
+        i = bisect_left(keys, key)
+        keys.insert(i, key)
+        self._products.setdefault(category, []).insert(i, product)
+        value = product.get_total_value()
+        self._values[category] = self._values.get(category, 0) + value
+        self._entries[id(product)] = (category, key, value)
+    
+    def _delete(self, product: Product) -> int:
+        """인덱스에서 상품을 빼고 등록 순서를 반환한다"""
+        entry = self._entries.pop(id(product), None)
+        if entry is None:
+            raise KeyError(f"카탈로그에 없는 상품: {product.name}")
+        category, key, value = entry
+        keys = self._keys[category]
+        i = bisect_left(keys, key)
+        del keys[i]
+        del self._products[category][i]
+        self._values[category] -= value
+        return key[1]
+    
+    def add(self, product: Product) -> None:
+        """
+        상품을 등록한다
+        
+        Args:
+            product: 등록할 상품
+        """
+        if id(product) in self._entries:
+            raise ValueError(f"이미 등록된 상품: {product.name}")
+        self._insert(product, self._next_seq)
+        self._next_seq += 1
+    
+    def remove(self, product: Product) -> None:
+        """
+        상품을 삭제한다
+        
+        Args:
+            product: 삭제할 상품
+        """
+        self._delete(product)
+    
+    def reprice(self, product: Product, new_price: int) -> None:
+        """
+        상품 가격을 바꾸고 인덱스를 갱신한다
+        
+        Args:
+            product: 등록된 상품
+            new_price: 새 가격
+        """
+        seq = self._delete(product)
+        product.price = new_price
+        self._insert(product, seq)
+    
+    def update_quantity(self, product: Product, quantity: int) -> None:
+        """
+        상품 수량을 바꾸고 카테고리 총 가치를 갱신한다
+        
+        Args:
+            product: 등록된 상품
+            quantity: 새 수량
+        """
+        category, key, value = self._entries[id(product)]
+        product.quantity = quantity
+        new_value = product.get_total_value()
+        self._values[category] += new_value - value
+        self._entries[id(product)] = (category, key, new_value)
+    
+    def find(self, category: str, min_price: int, max_price: int) -> list[Product]:
+        """
+        카테고리에서 가격이 min_price 이상 max_price 이하인 상품을 찾는다
+        
+        Args:
+            category: 카테고리
+            min_price: 최소 가격
+            max_price: 최대 가격
+        
+        Returns:
+            가격 오름차순 상품 리스트
+        """
+        keys = self._keys.get(category)
+        if not keys:
+            return []
+        start = bisect_left(keys, (min_price, -1))
+        end = bisect_right(keys, (max_price, self._next_seq))
+        return self._products[category][start:end]
+    
+    def get_total_value(self, category: str) -> int:
+        """
+        카테고리 상품들의 총 가치를 반환한다 (O(1))
+        
+        Args:
+            category: 카테고리
+        
+        Returns:
+            카테고리 총 가치 (가격 × 수량의 합)
+        """
+        return self._values.get(category, 0)
+    
+    def category_values(self) -> dict[str, int]:
+        """모든 카테고리의 총 가치를 반환한다"""
+        return {category: value for category, value in self._values.items() if self._keys[category]}
+
+
+# ========================================
+# 7. 대량 처리: 배열 기반 재고 가치 계산
+# ========================================
+
+class TrackedProduct(Product):
+    """
+    재고 가치 계산기(InventoryValuation)에 가격/수량/카테고리 변경을 알리는 Product
+    
+    직접 대입(product.quantity = 50)으로 값이 바뀌면
+    계산기의 배열이 자동으로 갱신된다.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        price: int,
+        quantity: int = 0,
+        category: str = "기타"
+    ):
+        self.valuation: InventoryValuation | None = None
+        super().__init__(name, price, quantity, category)
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        valuation = self.__dict__.get("valuation")
+        if valuation is not None and name in ("price", "quantity", "category"):
+            valuation.update(self)
+
+
+class InventoryValuation:
+    """
+    Product의 가격과 수량을 카테고리별 정수 배열에 모아 가치를 계산한다
+    
+    상품마다 get_total_value()를 호출하는 대신
+    가격 배열과 수량 배열을 map(mul, ...)로 한 번에 곱해 더한다.
+    
+    TrackedProduct는 값이 바뀌면 배열이 자동으로 갱신된다.
+    일반 Product는 자동으로 맞춰지지 않으므로, 값을 바꾼 뒤
+    update(상품) 또는 refresh()를 호출하기 전까지는
+    total_value(), category_values(), top()이 이전 값으로 계산된다.
+    """
+    
+    def __init__(self, products: list[Product] | None = None) -> None:
+        """
+        Args:
+            products: 처음에 담을 상품 리스트
+        """
+        self._prices: dict[str, "array[int]"] = {}
+        self._quantities: dict[str, "array[int]"] = {}
+        self._products: dict[str, list[Product]] = {}
+        self._rows: dict[int, tuple[str, int]] = {}  # id → (카테고리, 행 번호)
+        for product in products or []:
+            self.add(product)
+    
+    def _clear(self) -> None:
+        self._prices.clear()
+        self._quantities.clear()
+        self._products.clear()
+        self._rows.clear()
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def add(self, product: Product) -> None:
+        """
+        상품을 추가한다
+        
+        Args:
+            product: 추가할 상품 (TrackedProduct는 다른 계산기에 속하지 않아야 한다)
+        """
+        if id(product) in self._rows:
+            raise ValueError(f"이미 추가된 상품: {product.name}")
+        if isinstance(product, TrackedProduct):
+            if product.valuation is not None and product.valuation is not self:
+                raise ValueError(f"다른 계산기에 속한 상품: {product.name}")
+            product.valuation = self
+        category = product.category
+        if category not in self._products:
+            self._prices[category] = array("q")
+            self._quantities[category] = array("q")
+            self._products[category] = []
+        self._rows[id(product)] = (category, len(self._products[category]))
+        self._prices[category].append(product.price)
+        self._quantities[category].append(product.quantity)
+        self._products[category].append(product)
+    
+    def remove(self, product: Product) -> None:
+        """
+        상품을 뺀다 (마지막 행을 빈자리로 옮겨 O(1)로 처리한다)
+        
+        Args:
+            product: 뺄 상품
+        """
+        category, row = self._rows.pop(id(product))
+        prices = self._prices[category]
+        quantities = self._quantities[category]
+        products = self._products[category]
+        last = products[-1]
+        if last is not product:
+            prices[row] = prices[-1]
+            quantities[row] = quantities[-1]
+            products[row] = last
+            self._rows[id(last)] = (category, row)
+        prices.pop()
+        quantities.pop()
+        products.pop()
+        if isinstance(product, TrackedProduct):
+            product.valuation = None
+    
+    def update(self, product: Product) -> None:
+        """
+        상품 하나의 가격/수량/카테고리 변경을 배열에 반영한다
+        
+        일반 Product는 값을 바꾼 뒤 직접 호출해야 한다.
+        TrackedProduct는 값이 바뀔 때 자동으로 호출된다.
+        
+        Args:
+            product: 값이 바뀐 상품
+        """
+        category, row = self._rows[id(product)]
+        if category != product.category:
+            self.remove(product)
+            self.add(product)
+            return
+        self._prices[category][row] = product.price
+        self._quantities[category][row] = product.quantity
+    
+    def refresh(self) -> None:
+        """모든 상품의 현재 값을 다시 읽어 배열을 만든다 (여러 일반 Product를 바꾼 뒤)"""
+        products = [product for group in self._products.values() for product in group]
+        self._clear()
+        for product in products:
+            self.add(product)
+    
+    def category_values(self) -> dict[str, int]:
+        """
+        카테고리별 총 가치를 계산한다
+        
+        일반 Product는 마지막 update()/refresh() 시점의 값으로 계산한다.
+        
+        Returns:
+            {카테고리: 가격 × 수량의 합} 딕셔너리
+        """
+        return {
+            category: sum(map(mul, self._prices[category], self._quantities[category]))
+            for category in self._products
+            if self._products[category]
+        }
+    
+    def total_value(self) -> int:
+        """전체 재고 가치를 계산한다 (일반 Product는 마지막 update()/refresh() 시점의 값)"""
+        return sum(self.category_values().values())
+    
+    def top(self, n: int) -> list[tuple[Product, int]]:
+        """
+        가치가 가장 큰 상품 n개를 반환한다
+        
+        일반 Product는 마지막 update()/refresh() 시점의 값으로 계산한다.
+        
+        Args:
+            n: 상품 수
+        
+        Returns:
+            (상품, 가치) 리스트 (가치 내림차순)
+        """
+        rows = chain.from_iterable(
+            zip(self._products[category], map(mul, self._prices[category], self._quantities[category]))
+            for category in self._products
+        )
+        return heapq.nlargest(n, rows, key=itemgetter(1))
+
+
+# ========================================
+# 8. 대량 처리: 한꺼번에 인스턴스 만들기
+# ========================================
+
+def benchmark_bulk_construction(n: int = 100000, rounds: int = 5) -> list[tuple[str, float, float]]:
+    """
+    반복문으로 하나씩 만드는 방식과 from_records/from_columns를 비교한다
+    
+    각 방식을 rounds번 실행해 가장 짧은 시간을 쓴다.
+    시간 대부분이 __init__ 호출이므로 차이는 반복문 자체의 비용 정도다.
+    
+    Args:
+        n: 만들 인스턴스 수
+        rounds: 방식마다 반복할 횟수
+    
+    Returns:
+        (방식, 반복문 소요 시간, 일괄 생성 소요 시간) 리스트 (초 단위)
+    """
+    book_records = [(f"책{i}", "저자", 100 + i % 500, 10000 + i) for i in range(n)]
+    product_records = [(f"상품{i}", 1000 + i) for i in range(n)]
+    book_columns = list(zip(*book_records))
+    product_columns = list(zip(*product_records))
+    
+    def timed(build) -> float:
+        return min(timeit.repeat(build, number=1, repeat=rounds))
+    
+    book_loop = timed(lambda: [Book(t, a, p, c) for t, a, p, c in book_records])
+    product_loop = timed(lambda: [Product(name, price) for name, price in product_records])
+    return [
+        ("Book.from_records", book_loop, timed(lambda: Book.from_records(book_records))),
+        ("Book.from_columns", book_loop, timed(lambda: Book.from_columns(*book_columns))),
+        ("Product.from_records", product_loop, timed(lambda: Product.from_records(product_records))),
+        ("Product.from_columns", product_loop, timed(lambda: Product.from_columns(*product_columns))),
+    ]
+
+
+# ========================================
+# 9. 대량 처리: greet/get_info 결과 캐시
+# ========================================
+
+class CachedPersonWithMethods(PersonWithMethods):
+    """
+    greet()와 get_info()의 결과 문자열을 기억해 두는 PersonWithMethods
+    
+    필드가 바뀌면 그 필드를 쓰는 결과만 지운다.
+    celebrate_birthday(), update_email(), 직접 대입(person.age = 30)은
+    모두 __setattr__을 거치므로 자동으로 반영된다.
+    """
+    
+    # 필드별로 다시 만들어야 하는 캐시
+    _RENDER_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+        "name": ("_greet_cache", "_info_cache"),
+        "age": ("_greet_cache", "_info_cache"),
+        "email": ("_info_cache",),
+    }
+    
+    # 클래스 변수: 모든 인스턴스의 캐시 적중/실패 횟수
+    cache_hits: int = 0
+    cache_misses: int = 0
+    
+    def __init__(self, name: str, age: int, email: str):
+        self._greet_cache: str | None = None
+        self._info_cache: str | None = None
+        super().__init__(name, age, email)
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        for cache_name in self._RENDER_DEPENDENCIES.get(name, ()):
+            super().__setattr__(cache_name, None)
+    
+    def greet(self) -> str:
+        """인사 메시지를 반환한다 (바뀐 필드가 없으면 기억해 둔 문자열)"""
+        if self._greet_cache is None:
+            CachedPersonWithMethods.cache_misses += 1
+            self._greet_cache = super().greet()
+        else:
+            CachedPersonWithMethods.cache_hits += 1
+        return self._greet_cache
+    
+    def get_info(self) -> str:
+        """상세 정보를 반환한다 (바뀐 필드가 없으면 기억해 둔 문자열)"""
+        if self._info_cache is None:
+            CachedPersonWithMethods.cache_misses += 1
+            self._info_cache = super().get_info()
+        else:
+            CachedPersonWithMethods.cache_hits += 1
+        return self._info_cache
+    
+    def cache_memory(self) -> int:
+        """
+        이 인스턴스가 기억해 둔 문자열의 크기를 반환한다
+        
+        Returns:
+            바이트 수
+        """
+        return sum(
+            sys.getsizeof(cached)
+            for cached in (self._greet_cache, self._info_cache)
+            if cached is not None
+        )
+    
+    @classmethod
+    def cache_hit_ratio(cls) -> float:
+        """
+        전체 호출 중 캐시에서 바로 돌려준 비율을 반환한다
+        
+        Returns:
+            적중률 (0.0 ~ 1.0)
+        """
+        calls = cls.cache_hits + cls.cache_misses
+        return cls.cache_hits / calls if calls else 0.0
+
+
+# ========================================
+# 10. 대량 처리: 이메일/이름 인덱스가 있는 사용자 등록부
+# ========================================
+
+class RegisteredPerson(PersonWithMethods):
+    """
+    등록부(PeopleRegistry)에 이름/이메일 변경을 알리는 PersonWithMethods
+    
+    update_email()이나 직접 대입으로 email, name이 바뀌면
+    등록부의 인덱스가 자동으로 갱신된다.
+    이미 다른 사람이 쓰는 이메일로는 바꿀 수 없다 (ValueError).
+    """
+    
+    def __init__(self, name: str, age: int, email: str):
+        self.registry: PeopleRegistry | None = None
+        super().__init__(name, age, email)
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        registry = self.__dict__.get("registry")
+        if registry is None or name not in ("name", "email"):
+            super().__setattr__(name, value)
+            return
+        old = getattr(self, name)
+        registry._check_change(self, name, value)
+        super().__setattr__(name, value)
+        registry._reindex(self, name, old, value)
+
+
+class PeopleRegistry:
+    """
+    RegisteredPerson을 이메일과 이름으로 빠르게 찾는 등록부
+    
+    - 이메일 해시 인덱스: 조회와 중복 확인이 O(1)
+    - 이름 정렬 인덱스: (이름, 등록 순서) 정렬 리스트에서 bisect로 접두어 검색
+    """
+    
+    def __init__(self) -> None:
+        self._by_email: dict[str, RegisteredPerson] = {}
+        self._name_keys: list[tuple[str, int]] = []  # (이름, 등록 순서) 정렬
+        self._name_people: list[RegisteredPerson] = []  # _name_keys와 같은 순서
+        self._seq: dict[int, int] = {}  # id → 등록 순서
+        self._next_seq = 0
+    
+    def __len__(self) -> int:
+        return len(self._by_email)
+    
+    def _insert_name(self, person: RegisteredPerson, name: str) -> None:
+        key = (name, self._seq[id(person)])
+        i = bisect_left(self._name_keys, key)
+        self._name_keys.insert(i, key)
+        self._name_people.insert(i, person)
+    
+    def _delete_name(self, person: RegisteredPerson, name: str) -> None:
+        i = bisect_left(self._name_keys, (name, self._seq[id(person)]))
+        del self._name_keys[i]
+        del self._name_people[i]
+    
+    def register(self, person: RegisteredPerson) -> None:
+        """
+        사람을 등록한다
+        
+        Args:
+            person: 등록할 사람 (다른 등록부에 속하지 않아야 한다)
+        """
+        if person.registry is not None:
+            raise ValueError(f"이미 등록된 사람: {person.name}")
+        if person.email in self._by_email:
+            raise ValueError(f"이미 사용 중인 이메일: {person.email}")
+        self._by_email[person.email] = person
+        self._seq[id(person)] = self._next_seq
+        self._next_seq += 1
+        self._insert_name(person, person.name)
+        person.registry = self
+    
+    def unregister(self, person: RegisteredPerson) -> None:
+        """
+        등록을 해제한다
+        
+        Args:
+            person: 등록된 사람
+        """
+        if person.registry is not self:
+            raise KeyError(person.email)
+        del self._by_email[person.email]
+        self._delete_name(person, person.name)
+        del self._seq[id(person)]
+        person.registry = None
+    
+    def is_email_taken(self, email: str) -> bool:
+        """이메일이 이미 사용 중인지 확인한다 (O(1))"""
+        return email in self._by_email
+    
+    def find_by_email(self, email: str) -> RegisteredPerson | None:
+        """
+        이메일로 사람을 찾는다 (O(1))
+        
+        Args:
+            email: 이메일 주소
+        
+        Returns:
+            사람 또는 None (없는 경우)
+        """
+        return self._by_email.get(email)
+    
+    def find_by_name_prefix(self, prefix: str) -> list[RegisteredPerson]:
+        """
+        이름이 prefix로 시작하는 사람들을 찾는다 (O(log n + k))
+        
+        Args:
+            prefix: 이름 접두어
+        
+        Returns:
+            이름 순서의 사람 리스트
+        """
+        i = bisect_left(self._name_keys, (prefix, -1))
+        end = i
+        while end < len(self._name_keys) and self._name_keys[end][0].startswith(prefix):
+            end += 1
+        return self._name_people[i:end]
+    
+    def _check_change(self, person: RegisteredPerson, field: str, value: object) -> None:
+        """필드를 바꾸기 전에 이메일 중복을 확인한다"""
+        if field == "email" and isinstance(value, str):
+            owner = self._by_email.get(value)
+            if owner is not None and owner is not person:
+                raise ValueError(f"이미 사용 중인 이메일: {value}")
+    
+    def _reindex(self, person: RegisteredPerson, field: str, old: object, new: object) -> None:
+        """필드가 바뀐 뒤 인덱스를 갱신한다"""
+        if field == "email":
+            self._by_email.pop(str(old), None)
+            self._by_email[str(new)] = person
+        elif field == "name":
+            self._delete_name(person, str(old))
+            self._insert_name(person, str(new))
 
 
 # ========================================
@@ -286,6 +1082,117 @@ if __name__ == "__main__":
     for person in people:
         print(f"  - {person.greet()}")
     
+    print("\n" + "=" * 60)
+    print("7. 대량 처리: __slots__로 인스턴스 메모리 줄이기")
+    print("=" * 60)
+    
+    slotted = SlottedProduct("마우스", 30000, 10, "전자제품")
+    slotted.display()
+    print(f"__dict__ 있음? 일반: {hasattr(product2, '__dict__')}, slots: {hasattr(slotted, '__dict__')}")
+    
+    print(f"\n{'클래스':<26}{'바이트/개':>10}{'생성(ms)':>10}{'접근(ms)':>10}")
+    for class_name, size, construct_seconds, access_seconds in benchmark_slots(20000):
+        print(f"{class_name:<26}{size:>10.0f}{construct_seconds * 1000:>10.1f}{access_seconds * 1000:>10.1f}")
+    
+    print("\n" + "=" * 60)
+    print("8. 대량 처리: 카테고리 + 가격 구간 상품 인덱스")
+    print("=" * 60)
+    
+    catalog = ProductCatalog()
+    for item in [
+        product1,
+        product2,
+        product3,
+        Product("모니터", 250000, 3, "전자제품"),
+        Product("이어폰", 120000, 7, "전자제품"),
+        Product("티셔츠", 15000, 20, "의류"),
+    ]:
+        catalog.add(item)
+    
+    found = catalog.find("전자제품", 50000, 200000)
+    print(f"\n전자제품 5만~20만원: {[item.name for item in found]}")
+    print(f"카테고리별 총 가치: {catalog.category_values()}")
+    
+    catalog.reprice(product3, 45000)  # 키보드 할인
+    found = catalog.find("전자제품", 50000, 200000)
+    print(f"키보드 가격 변경 후: {[item.name for item in found]}")
+    
+    print("\n" + "=" * 60)
+    print("9. 대량 처리: 배열 기반 재고 가치 계산")
+    print("=" * 60)
+    
+    inventory = [product1, product2, product3, Product("티셔츠", 15000, 20, "의류")]
+    valuation = InventoryValuation(inventory)
+    print(f"\n전체 재고 가치: {valuation.total_value():,}원")
+    print(f"카테고리별: {valuation.category_values()}")
+    print(f"가치 상위 2개: {[(item.name, value) for item, value in valuation.top(2)]}")
+    
+    product2.quantity = 50  # 마우스 입고
+    valuation.update(product2)
+    print(f"마우스 입고 후 전체: {valuation.total_value():,}원 "
+          f"(get_total_value 합계: {sum(item.get_total_value() for item in inventory):,}원)")
+    
+    hoodie = TrackedProduct("후드티", 40000, 5, "의류")
+    valuation.add(hoodie)
+    hoodie.quantity = 15  # TrackedProduct는 update() 없이 반영된다
+    print(f"후드티 입고 후 의류: {valuation.category_values()['의류']:,}원")
+    
+    print("\n" + "=" * 60)
+    print("10. 대량 처리: 한꺼번에 인스턴스 만들기")
+    print("=" * 60)
+    
+    books = Book.from_records([("파이썬 코딩의 기술", "브렛 슬라킨", 400, 30000), ("클린 코드", "로버트 C. 마틴", 584, 33000)])
+    print(f"\nfrom_records: {[book.title for book in books]}")
+    
+    products = Product.from_columns(["마우스", "키보드"], [30000, 80000], categories=["전자제품", "전자제품"])
+    for item in products:
+        item.display()
+    print(f"하나씩 만든 것과 같은가: {vars(products[0]) == vars(Product('마우스', 30000, category='전자제품'))}")
+    
+    print(f"\n{'방식':<24}{'반복문(ms)':>12}{'일괄(ms)':>12}")
+    for label, loop_seconds, bulk_seconds in benchmark_bulk_construction(50000):
+        print(f"{label:<24}{loop_seconds * 1000:>12.1f}{bulk_seconds * 1000:>12.1f}")
+    
+    print("\n" + "=" * 60)
+    print("11. 대량 처리: greet/get_info 결과 캐시")
+    print("=" * 60)
+    
+    cached_user = CachedPersonWithMethods("박민수", 26, "park@example.com")
+    for _ in range(3):
+        cached_user.greet()
+        cached_user.get_info()
+    print(f"\n3번씩 호출: 적중 {CachedPersonWithMethods.cache_hits}, 실패 {CachedPersonWithMethods.cache_misses}")
+    
+    cached_user.update_email("minsu.park@newmail.com")  # get_info 캐시만 지워진다
+    print(cached_user.greet())
+    print(cached_user.get_info())
+    print(f"이메일 변경 후: 적중 {CachedPersonWithMethods.cache_hits}, 실패 {CachedPersonWithMethods.cache_misses}")
+    print(f"적중률: {CachedPersonWithMethods.cache_hit_ratio():.0%}, 캐시 크기: {cached_user.cache_memory()}바이트")
+    
+    print("\n" + "=" * 60)
+    print("12. 대량 처리: 이메일/이름 인덱스가 있는 사용자 등록부")
+    print("=" * 60)
+    
+    registry = PeopleRegistry()
+    for member in [
+        RegisteredPerson("김철수", 25, "kim@example.com"),
+        RegisteredPerson("김영희", 30, "younghee@example.com"),
+        RegisteredPerson("박민수", 28, "park@example.com"),
+    ]:
+        registry.register(member)
+    
+    kim = registry.find_by_email("kim@example.com")
+    print(f"\nkim@example.com: {kim.get_info() if kim else None}")
+    print(f"'김'으로 시작하는 이름: {[member.name for member in registry.find_by_name_prefix('김')]}")
+    
+    if kim:
+        kim.update_email("cheolsu@example.com")  # 인덱스가 자동으로 갱신된다
+        print(f"kim@example.com 사용 중? {registry.is_email_taken('kim@example.com')}")
+        try:
+            kim.update_email("park@example.com")
+        except ValueError as error:
+            print(f"변경 거부: {error}")
+    
     print("\n" + "=" * 60)
     print("학습 완료!")
     print("=" * 60)
@@ -3,6 +3,11 @@ Chapter 2-2: 필드(Fields)와 메서드(Methods)
 인스턴스 변수, 클래스 변수, 그리고 다양한 메서드를 학습한다.
 """
 
+import threading
+import time
+from array import array
+from collections import deque
+from operator import add
 from typing import Optional
 
 
@@ -315,6 +320,421 @@ class Employee:
         return int(salary * tax_rate)
 
 
+# ========================================
+# 6. 대량 처리: 스레드 안전한 샤딩 카운터
+# ========================================
+
+class _TallyShard:
+    """스레드 하나가 전용으로 쓰는 칸 (누적 개수)"""
+    
+    __slots__ = ("count",)
+    
+    def __init__(self) -> None:
+        self.count = 0
+
+
+class ShardedTally:
+    """
+    스레드마다 자기 칸에만 더하고, 읽을 때 모든 칸을 합치는 집계기
+    
+    add()는 자기 스레드의 칸에 더하기만 하므로 락 없이도 값이 어긋나지 않는다.
+    이동 구간 속도(rate)는 읽는 쪽에서 계산한다.
+    value나 rate()로 합계를 읽을 때마다 (시각, 합계) 샘플을 초당 하나씩 남기고,
+    구간 시작 시점의 샘플과 현재 합계의 차이로 속도를 구한다.
+    """
+    
+    def __init__(self, max_window: int = 60):
+        """
+        Args:
+            max_window: rate()로 조회할 수 있는 최대 구간 (초)
+        """
+        self.max_window = max_window
+        self._local = threading.local()
+        self._shards: list[_TallyShard] = []
+        self._lock = threading.Lock()
+        self._samples: deque[tuple[float, int]] = deque([(time.monotonic(), 0)])
+    
+    def _register(self) -> _TallyShard:
+        """현재 스레드의 칸을 만들어 등록한다 (스레드마다 한 번)"""
+        shard = _TallyShard()
+        with self._lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+    
+    def add(self, n: int = 1) -> None:
+        """
+        개수를 더한다
+        
+        Args:
+            n: 더할 개수
+        """
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._register()
+        shard.count += n
+    
+    def _fold(self) -> tuple[float, int]:
+        """모든 칸을 합치고 (시각, 합계) 샘플을 남긴다 (락을 잡은 상태에서 호출)"""
+        now = time.monotonic()
+        total = sum(shard.count for shard in self._shards)
+        samples = self._samples
+        if len(samples) > 1 and int(samples[-1][0]) == int(now):
+            samples[-1] = (now, total)  # 같은 초의 샘플은 하나만 둔다
+        else:
+            samples.append((now, total))
+        # 가장 긴 구간의 시작 시점 이전 샘플은 하나만 남긴다
+        while len(samples) > 2 and samples[1][0] <= now - self.max_window:
+            samples.popleft()
+        return now, total
+    
+    @property
+    def value(self) -> int:
+        """모든 칸을 합친 누적 개수"""
+        with self._lock:
+            return self._fold()[1]
+    
+    def rate(self, seconds: int) -> float:
+        """
+        최근 seconds초 동안의 초당 개수를 반환한다
+        
+        구간 시작 시점 이전의 가장 최근 샘플부터 지금까지의 평균이다.
+        합계를 드물게 읽었다면 그만큼 더 긴 구간의 평균이 된다.
+        
+        Args:
+            seconds: 구간 길이 (1 ~ max_window)
+        
+        Returns:
+            초당 개수
+        """
+        if not 1 <= seconds <= self.max_window:
+            raise ValueError(f"구간은 1 ~ {self.max_window}초여야 한다")
+        with self._lock:
+            now, total = self._fold()
+            since = now - seconds
+            base_time, base_total = self._samples[0]
+            if base_time > since:
+                # 첫 샘플은 생성 시점(합계 0)이므로 그 이전에는 센 것이 없다
+                return total / seconds
+            for sample_time, sample_total in self._samples:
+                if sample_time > since:
+                    break
+                base_time, base_total = sample_time, sample_total
+        return (total - base_total) / (now - base_time)
+
+
+class ConcurrentCounter:
+    """
+    여러 스레드에서 동시에 써도 값이 어긋나지 않는 Counter
+    
+    Counter와 같은 기능이지만 개별 개수와 전체 개수(total_count)를
+    스레드별 칸에 세고 읽을 때 합친다.
+    """
+    
+    # 클래스 변수: 모든 인스턴스가 공유하는 생성 개수 집계기
+    _total: ShardedTally = ShardedTally()
+    
+    def __init__(self, name: str):
+        """
+        ConcurrentCounter 인스턴스를 초기화한다
+        
+        Args:
+            name: 카운터 이름
+        """
+        self.name = name
+        self._count = ShardedTally()
+        ConcurrentCounter._total.add()
+    
+    def increment(self) -> None:
+        """개별 카운터를 증가시킨다"""
+        self._count.add()
+    
+    @property
+    def count(self) -> int:
+        """개별 카운터 값"""
+        return self._count.value
+    
+    def rate(self, seconds: int = 10) -> float:
+        """
+        최근 seconds초 동안의 초당 증가 횟수를 반환한다
+        
+        Args:
+            seconds: 구간 길이 (초)
+        """
+        return self._count.rate(seconds)
+    
+    @classmethod
+    def get_total_count(cls) -> int:
+        """
+        생성된 카운터 총 개수를 반환한다 (Counter.total_count에 해당)
+        
+        Returns:
+            총 개수
+        """
+        return cls._total.value
+    
+    def get_info(self) -> str:
+        """카운터 정보를 반환한다"""
+        return f"{self.name}: {self.count} (전체: {ConcurrentCounter.get_total_count()})"
+
+
+# ========================================
+# 7. 대량 처리: 배열 기반 계좌 원장
+# ========================================
+
+class AccountLedger:
+    """
+    많은 계좌의 잔액을 정수 배열 하나에 모아 관리하는 원장
+    
+    BankAccount 객체마다 apply_interest()를 호출하는 대신
+    잔액 배열 전체에 이자를 한 번에 적용한다.
+    이자 계산(int() 버림)과 입출금 거절 규칙은 BankAccount와 같다.
+    """
+    
+    def __init__(self, interest_rate: Optional[float] = None):
+        """
+        Args:
+            interest_rate: 이자율 (None이면 BankAccount.interest_rate)
+        """
+        self.interest_rate = BankAccount.interest_rate if interest_rate is None else interest_rate
+        self.owners: list[str] = []
+        self.balances = array("q")
+        self._index: dict[str, int] = {}  # 소유자 → 배열 위치
+    
+    @classmethod
+    def from_accounts(cls, accounts: list[BankAccount]) -> "AccountLedger":
+        """
+        BankAccount 리스트로 원장을 만든다
+        
+        Args:
+            accounts: 계좌 리스트 (소유자가 겹치지 않아야 한다)
+        
+        Returns:
+            AccountLedger 인스턴스
+        """
+        ledger = cls()
+        for account in accounts:
+            ledger.open(account.owner, account.balance)
+        return ledger
+    
+    def to_accounts(self) -> list[BankAccount]:
+        """원장의 계좌들을 BankAccount 리스트로 만든다"""
+        return [BankAccount(owner, balance) for owner, balance in zip(self.owners, self.balances)]
+    
+    def __len__(self) -> int:
+        return len(self.owners)
+    
+    def open(self, owner: str, balance: int = 0) -> None:
+        """
+        계좌를 추가한다
+        
+        Args:
+            owner: 계좌 소유자
+            balance: 초기 잔액 (기본값: 0)
+        """
+        if owner in self._index:
+            raise ValueError(f"이미 있는 계좌: {owner}")
+        self._index[owner] = len(self.owners)
+        self.owners.append(owner)
+        self.balances.append(balance)
+    
+    def get_balance(self, owner: str) -> int:
+        """
+        잔액을 조회한다
+        
+        Args:
+            owner: 계좌 소유자
+        
+        Returns:
+            현재 잔액
+        """
+        return self.balances[self._index[owner]]
+    
+    def apply_interest(self) -> None:
+        """모든 계좌에 이자를 한 번에 적용한다 (잔액 + int(잔액 × 이자율))"""
+        balances = self.balances
+        interests = map(int, map(self.interest_rate.__rmul__, balances))
+        self.balances = array("q", map(add, balances, interests))
+    
+    def deposit_batch(self, rows: list[tuple[str, int]]) -> list[bool]:
+        """
+        여러 건의 입금을 순서대로 처리한다
+        
+        Args:
+            rows: (소유자, 입금액) 리스트
+        
+        Returns:
+            행별 성공 여부 (없는 소유자이거나 입금액이 0 이하이면 거절)
+        """
+        balances = self.balances
+        index = self._index
+        results: list[bool] = []
+        for owner, amount in rows:
+            i = index.get(owner)
+            if i is None or amount <= 0:
+                results.append(False)
+                continue
+            balances[i] += amount
+            results.append(True)
+        return results
+    
+    def withdraw_batch(self, rows: list[tuple[str, int]]) -> list[bool]:
+        """
+        여러 건의 출금을 순서대로 처리한다
+        
+        Args:
+            rows: (소유자, 출금액) 리스트
+        
+        Returns:
+            행별 성공 여부 (없는 소유자이거나 출금액이 0 이하이거나 잔액보다 크면 거절)
+        """
+        balances = self.balances
+        index = self._index
+        results: list[bool] = []
+        for owner, amount in rows:
+            i = index.get(owner)
+            if i is None or amount <= 0 or amount > balances[i]:
+                results.append(False)
+                continue
+            balances[i] -= amount
+            results.append(True)
+        return results
+    
+    def project(self, periods: int) -> list[int]:
+        """
+        모든 계좌의 periods 기간 뒤 잔액을 정확히 계산한다 (원장은 바꾸지 않는다)
+        
+        기간마다 apply_interest()와 같은 계산을 배열 전체에 적용하고,
+        더 이상 변하는 잔액이 없으면 멈춘다.
+        
+        Args:
+            periods: 기간 수
+        
+        Returns:
+            소유자 순서대로의 예상 잔액 리스트
+        """
+        rate = self.interest_rate
+        balances = self.balances
+        for _ in range(periods):
+            projected = array("q", map(add, balances, map(int, map(rate.__rmul__, balances))))
+            if projected == balances:
+                break
+            balances = projected
+        return balances.tolist()
+    
+    def estimate(self, periods: int) -> list[tuple[float, float]]:
+        """
+        모든 계좌의 periods 기간 뒤 잔액 범위를 공식으로 계산한다 (근사)
+        
+        복리 배수는 한 번만 계산해 모든 계좌에 곱한다.
+        범위 계산과 입력 검사는 estimate_balance와 같다
+        (잔액이 음수인 계좌가 있거나 이자율이 음수이면 ValueError).
+        
+        Args:
+            periods: 기간 수
+        
+        Returns:
+            소유자 순서대로의 (최소 잔액, 최대 잔액) 리스트
+        """
+        rate = self.interest_rate
+        factor = compound_factor(rate, periods)
+        return [_balance_range(balance, rate, factor) for balance in self.balances]
+
+
+# ========================================
+# 8. 대량 처리: 여러 기간 뒤 잔액 예측
+# ========================================
+
+# apply_interest()는 매 기간 int()로 이자를 버림하므로
+# 잔액 × (1 + 이자율)^기간 공식과 정확히 일치하지 않는다.
+# - project_balance: 버림까지 그대로 재현하는 정확한 계산
+#   (이자가 0이 되면 잔액이 더 변하지 않으므로 바로 멈춘다)
+# - estimate_balance: 거듭제곱 공식으로 O(log N)에 구하는 근사 범위
+#   (정확한 값은 항상 이 범위 안에 있다)
+
+
+def compound_factor(rate: float, periods: int) -> float:
+    """
+    (1 + rate)^periods를 제곱을 반복하는 방식으로 계산한다 (O(log periods))
+    
+    Args:
+        rate: 기간당 이자율
+        periods: 기간 수 (0 이상)
+    
+    Returns:
+        복리 배수
+    """
+    if periods < 0:
+        raise ValueError("기간은 0 이상이어야 한다")
+    result = 1.0
+    base = 1 + rate
+    while periods:
+        if periods & 1:
+            result *= base
+        base *= base
+        periods >>= 1
+    return result
+
+
+def project_balance(balance: int, periods: int, interest_rate: Optional[float] = None) -> int:
+    """
+    apply_interest()를 periods번 호출한 뒤의 잔액을 정확히 계산한다
+    
+    매 기간 int() 버림을 그대로 재현한다.
+    이자가 0이 되는 순간부터는 잔액이 변하지 않으므로 남은 기간은 건너뛴다.
+    
+    Args:
+        balance: 현재 잔액
+        periods: 기간 수
+        interest_rate: 이자율 (None이면 BankAccount.interest_rate)
+    
+    Returns:
+        예상 잔액 (apply_interest를 반복한 결과와 같다)
+    """
+    rate = BankAccount.interest_rate if interest_rate is None else interest_rate
+    for _ in range(periods):
+        interest = int(balance * rate)
+        if interest == 0:
+            break
+        balance += interest
+    return balance
+
+
+def estimate_balance(
+    balance: int,
+    periods: int,
+    interest_rate: Optional[float] = None
+) -> tuple[float, float]:
+    """
+    여러 기간 뒤 잔액의 범위를 공식으로 계산한다 (근사, O(log periods))
+    
+    - 최대: 버림이 없을 때의 잔액 = 잔액 × (1 + r)^N
+    - 최소: 매 기간 1원 가까이 버려질 때 = 최대 - ((1 + r)^N - 1) / r
+    project_balance의 정확한 값은 부동소수점 오차 범위에서 이 사이에 있다.
+    
+    Args:
+        balance: 현재 잔액 (0 이상)
+        periods: 기간 수
+        interest_rate: 이자율 (None이면 BankAccount.interest_rate, 0 이상)
+    
+    Returns:
+        (최소 잔액, 최대 잔액)
+    """
+    rate = BankAccount.interest_rate if interest_rate is None else interest_rate
+    return _balance_range(balance, rate, compound_factor(rate, periods))
+
+
+def _balance_range(balance: int, rate: float, factor: float) -> tuple[float, float]:
+    """복리 배수 factor = (1 + rate)^N으로 (최소 잔액, 최대 잔액)을 구한다"""
+    if balance < 0 or rate < 0:
+        raise ValueError("잔액과 이자율은 0 이상이어야 한다")
+    upper = balance * factor
+    if rate == 0:
+        return upper, upper
+    return max(float(balance), upper - (factor - 1) / rate), upper
+
+
 # ========================================
 # 메인 실행
 # ========================================
@@ -447,6 +867,51 @@ if __name__ == "__main__":
     emp1.give_raise(5000000)
     print(f"인상 후: {emp1.get_info()}")
     
+    print("\n" + "=" * 60)
+    print("6. 대량 처리: 스레드 안전한 샤딩 카운터")
+    print("=" * 60)
+    
+    shared_counter = ConcurrentCounter("공유 카운터")
+    
+    def worker() -> None:
+        ConcurrentCounter(f"{threading.current_thread().name} 카운터")
+        for _ in range(10000):
+            shared_counter.increment()
+    
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    print(f"\n스레드 8개 × 1만 번 증가")
+    print(shared_counter.get_info())
+    print(f"최근 10초 속도: {shared_counter.rate(10):,.0f}회/초")
+    
+    print("\n" + "=" * 60)
+    print("7. 대량 처리: 배열 기반 계좌 원장")
+    print("=" * 60)
+    
+    ledger = AccountLedger.from_accounts([account1, account2, BankAccount("박민수", 500000)])
+    print(f"\n초기 잔액: {dict(zip(ledger.owners, ledger.balances))}")
+    
+    print(f"입금 결과: {ledger.deposit_batch([('박민수', 100000), ('이영희', 0)])}")
+    print(f"출금 결과: {ledger.withdraw_batch([('박민수', 700000), ('박민수', 600000), ('김철수', 1)])}")
+    
+    ledger.apply_interest()
+    print(f"이자 적용 후: {dict(zip(ledger.owners, ledger.balances))}")
+    
+    print("\n" + "=" * 60)
+    print("8. 대량 처리: 여러 기간 뒤 잔액 예측")
+    print("=" * 60)
+    
+    years = 30
+    low, high = estimate_balance(1000000, years)
+    print(f"\n100만원, {years}기간 뒤")
+    print(f"정확한 값 (버림 재현): {project_balance(1000000, years):,}원")
+    print(f"공식 근사 범위: {low:,.0f}원 ~ {high:,.0f}원")
+    print(f"원장 전체 정확한 예측: {dict(zip(ledger.owners, ledger.project(years)))}")
+    
     print("\n" + "=" * 60)
     print("학습 완료!")
     print("=" * 60)